@@ -15,13 +15,14 @@ def main():
     """Main entry point."""
     # Handle --help / --version before creating QApplication
     if "--help" in sys.argv or "-h" in sys.argv:
-        print(f"Usage: merisio [--help] [--version]")
+        print(f"Usage: merisio [--help] [--version] [--opengl]")
         print()
         print(f"{APP_NAME} — a modern MERISE database modeling tool.")
         print()
         print("Options:")
         print("  -h, --help     Show this help message and exit")
         print("  -v, --version  Show version and exit")
+        print("  --opengl       Render the MCD canvas with OpenGL")
         print()
         print("When launched without arguments, the graphical editor opens.")
         print(f"See merisio(1) and merisio-cli(1) for full documentation.")
@@ -36,8 +37,12 @@ def main():
     from PySide6.QtGui import QIcon
 
     from src.views.main_window import MainWindow
+    from src.views.mcd_canvas import MCDCanvas
     from src.utils.theme import get_stylesheet
 
+    # GPU-composited canvas (opt-in, requires a working OpenGL driver)
+    MCDCanvas.USE_OPENGL = "--opengl" in sys.argv
+
     # Enable high DPI scaling
     QApplication.setHighDpiScaleFactorRoundingPolicy(
         Qt.HighDpiScaleFactorRoundingPolicy.PassThrough
@@ -1,7 +1,21 @@
-from dataclasses import dataclass, field
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional
 
 
+@lru_cache(maxsize=4096)
+def _display_text(name: str, data_type: str, size: Optional[int]) -> str:
+    """Format a diagram label once per (name, type, size).
+
+    Keyed on the fields the label is made of, so edits to an attribute
+    pick up a new label without any invalidation.
+    """
+    text = f"{name} : {data_type}"
+    if size:
+        text += f"({size})"
+    return text
+
+
 @dataclass
 class Attribute:
     """Represents a data dictionary attribute."""
@@ -11,6 +25,11 @@ class Attribute:
     size: Optional[int] = None
     is_primary_key: bool = False
 
+    @property
+    def display_text(self) -> str:
+        """Get the label shown on the diagram, e.g. "nom : VARCHAR(50)"."""
+        return _display_text(self.name, self.data_type, self.size)
+
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
         return {
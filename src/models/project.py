@@ -1,4 +1,4 @@
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 from datetime import datetime
 from .entity import Entity
 from .association import Association
@@ -112,6 +112,37 @@ class Project:
             del self._links[link_id]
             self.modified = True
 
+    def remove_elements(
+        self,
+        entity_ids: Iterable[str] = (),
+        association_ids: Iterable[str] = (),
+        link_ids: Iterable[str] = ()
+    ) -> None:
+        """Remove several entities, associations and links at once.
+
+        Links connected to a removed entity or association are removed too,
+        in a single pass over the links.
+        """
+        entity_ids = {eid for eid in entity_ids if eid in self._entities}
+        association_ids = {aid for aid in association_ids if aid in self._associations}
+        link_ids = {lid for lid in link_ids if lid in self._links}
+
+        if entity_ids or association_ids:
+            link_ids.update(
+                link_id for link_id, link in self._links.items()
+                if link.entity_id in entity_ids or link.association_id in association_ids
+            )
+        if not (entity_ids or association_ids or link_ids):
+            return
+
+        for link_id in link_ids:
+            del self._links[link_id]
+        for entity_id in entity_ids:
+            del self._entities[entity_id]
+        for association_id in association_ids:
+            del self._associations[association_id]
+        self.modified = True
+
     def get_link(self, link_id: str) -> Optional[Link]:
         """Get a link by ID."""
         return self._links.get(link_id)
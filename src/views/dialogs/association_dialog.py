@@ -9,6 +9,7 @@ from PySide6.QtCore import Qt
 from ...models.association import Association
 from ...models.attribute import Attribute
 from ...utils.constants import DATA_TYPES
+from .entity_dialog import AttributeEditDialog
 
 
 class AssociationDialog(QDialog):
@@ -129,8 +130,6 @@ class AssociationDialog(QDialog):
 
     def _on_add_attribute(self):
         """Add a new carrying attribute."""
-        from .entity_dialog import AttributeEditDialog
-
         dialog = AttributeEditDialog(parent=self)
         if dialog.exec():
             attr = dialog.get_attribute()
@@ -150,8 +149,6 @@ class AssociationDialog(QDialog):
 
     def _on_edit_attribute(self):
         """Edit selected attribute."""
-        from .entity_dialog import AttributeEditDialog
-
         row = self._get_selected_row()
         if row < 0:
             QMessageBox.information(self, "Info", "Please select an attribute to edit.")
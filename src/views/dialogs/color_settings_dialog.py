@@ -1,6 +1,6 @@
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QFormLayout,
-    QPushButton, QDialogButtonBox, QLabel, QFrame
+    QPushButton, QDialogButtonBox, QLabel, QFrame, QColorDialog
 )
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QColor
@@ -41,7 +41,6 @@ class ColorButton(QPushButton):
 
     def _pick_color(self):
         """Open color picker dialog."""
-        from PySide6.QtWidgets import QColorDialog
         color = QColorDialog.getColor(QColor(self._color), self, "Select Color")
         if color.isValid():
             self._color = color.name()
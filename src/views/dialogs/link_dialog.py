@@ -37,14 +37,19 @@ class LinkDialog(QDialog):
         # Entity and Association selection
         form = QFormLayout()
 
+        # id -> combo index, so preselection avoids findData's linear scan
+        self._entity_index: dict[str, int] = {}
         self._entity_combo = QComboBox()
-        for entity in self._entities:
+        for index, entity in enumerate(self._entities):
             self._entity_combo.addItem(entity.name, entity.id)
+            self._entity_index[entity.id] = index
         form.addRow("Entity:", self._entity_combo)
 
+        self._assoc_index: dict[str, int] = {}
         self._assoc_combo = QComboBox()
-        for assoc in self._associations:
+        for index, assoc in enumerate(self._associations):
             self._assoc_combo.addItem(assoc.name, assoc.id)
+            self._assoc_index[assoc.id] = index
         form.addRow("Association:", self._assoc_combo)
 
         layout.addLayout(form)
@@ -106,12 +111,12 @@ class LinkDialog(QDialog):
         """Load data from existing link if editing."""
         if self._link:
             # Set entity
-            index = self._entity_combo.findData(self._link.entity_id)
+            index = self.index_of_entity(self._link.entity_id)
             if index >= 0:
                 self._entity_combo.setCurrentIndex(index)
 
             # Set association
-            index = self._assoc_combo.findData(self._link.association_id)
+            index = self.index_of_association(self._link.association_id)
             if index >= 0:
                 self._assoc_combo.setCurrentIndex(index)
 
@@ -124,6 +129,14 @@ class LinkDialog(QDialog):
             if index >= 0:
                 self._card_max_combo.setCurrentIndex(index)
 
+    def index_of_entity(self, entity_id: str) -> int:
+        """Get the entity combo index for an entity id, or -1."""
+        return self._entity_index.get(entity_id, -1)
+
+    def index_of_association(self, association_id: str) -> int:
+        """Get the association combo index for an association id, or -1."""
+        return self._assoc_index.get(association_id, -1)
+
     def _update_preview(self):
         """Update the cardinality preview."""
         entity = self._entity_combo.currentText()
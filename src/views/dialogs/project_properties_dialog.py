@@ -1,3 +1,5 @@
+from datetime import datetime
+
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QFormLayout,
     QLineEdit, QTextEdit, QDialogButtonBox, QLabel
@@ -80,7 +82,6 @@ class ProjectPropertiesDialog(QDialog):
     def _format_timestamp(self, iso_timestamp: str) -> str:
         """Format ISO timestamp to human-readable format."""
         try:
-            from datetime import datetime
             dt = datetime.fromisoformat(iso_timestamp)
             return dt.strftime("%Y-%m-%d %H:%M:%S")
         except (ValueError, TypeError):
@@ -0,0 +1,27 @@
+"""Scalar geometry helpers for laying out diagram links."""
+
+
+def edge_point(cx: float, cy: float, hw: float, hh: float,
+               tx: float, ty: float) -> tuple[float, float]:
+    """Intersect the line from a box centre towards a target with the box edge.
+
+    The box has half-width hw and half-height hh; the result is (x, y).
+    """
+    dx = tx - cx
+    dy = ty - cy
+    if dx == 0 and dy == 0:
+        return cx, cy
+    # Scale the direction to reach the left/right or top/bottom edge
+    if abs(dx) * hh > abs(dy) * hw:
+        scale = hw / abs(dx)
+    else:
+        scale = hh / abs(dy)
+    return cx + dx * scale, cy + dy * scale
+
+
+def quad_point(x1: float, y1: float, cx: float, cy: float,
+               x2: float, y2: float, t: float) -> tuple[float, float]:
+    """Get the point at parameter t on a quadratic Bezier curve."""
+    u = 1 - t
+    return (u * u * x1 + 2 * u * t * cx + t * t * x2,
+            u * u * y1 + 2 * u * t * cy + t * t * y2)
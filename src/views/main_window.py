@@ -1,7 +1,8 @@
 from PySide6.QtWidgets import (
     QMainWindow, QTabWidget, QToolBar, QStatusBar,
     QMessageBox, QFileDialog, QWidget, QVBoxLayout,
-    QHBoxLayout, QPushButton, QLabel, QCheckBox, QSlider
+    QHBoxLayout, QPushButton, QLabel, QCheckBox, QSlider,
+    QSpacerItem, QSizePolicy
 )
 from PySide6.QtCore import Qt, QSize
 from PySide6.QtGui import QAction, QKeySequence, QIcon
@@ -15,6 +16,8 @@ from .dictionary_view import DictionaryView
 from .mcd_canvas import MCDCanvas
 from .mld_view import MLDView
 from .sql_view import SQLView
+from .dialogs.project_properties_dialog import ProjectPropertiesDialog
+from .dialogs.color_settings_dialog import ColorSettingsDialog
 
 
 class MainWindow(QMainWindow):
@@ -297,6 +300,12 @@ class MainWindow(QMainWindow):
         self._show_attributes_action.triggered.connect(self._on_toggle_attributes)
         options_menu.addAction(self._show_attributes_action)
 
+        self._show_grid_action = QAction("Show &Grid", self)
+        self._show_grid_action.setCheckable(True)
+        self._show_grid_action.setChecked(False)
+        self._show_grid_action.triggered.connect(self._on_toggle_grid)
+        options_menu.addAction(self._show_grid_action)
+
         options_menu.addSeparator()
 
         # Link style submenu
@@ -391,6 +400,7 @@ class MainWindow(QMainWindow):
 
     def _check_save(self) -> bool:
         """Check if user wants to save unsaved changes. Returns True to proceed."""
+        self._mcd_canvas.flush_modified()
         if not self._project.modified:
             return True
 
@@ -450,6 +460,7 @@ class MainWindow(QMainWindow):
 
     def _on_save(self) -> bool:
         """Save the current project."""
+        self._mcd_canvas.flush_modified()
         if not self._project.file_path:
             return self._on_save_as()
 
@@ -463,7 +474,7 @@ class MainWindow(QMainWindow):
 
     def _on_save_as(self) -> bool:
         """Save the project with a new name."""
-        import os
+        self._mcd_canvas.flush_modified()
         file_path, _ = QFileDialog.getSaveFileName(
             self, "Save Project", "", FILE_FILTER
         )
@@ -551,8 +562,6 @@ class MainWindow(QMainWindow):
 
     def _on_validate(self):
         """Validate the MCD model."""
-        from PySide6.QtWidgets import QSpacerItem, QSizePolicy
-
         controller = MCDController(self._project)
         errors = controller.validate()
 
@@ -577,8 +586,6 @@ class MainWindow(QMainWindow):
 
     def _on_project_properties(self):
         """Show project properties dialog."""
-        from .dialogs.project_properties_dialog import ProjectPropertiesDialog
-
         dialog = ProjectPropertiesDialog(self._project, parent=self)
         if dialog.exec():
             dialog.apply_to_project()
@@ -588,8 +595,6 @@ class MainWindow(QMainWindow):
 
     def _on_about(self):
         """Show about dialog."""
-        from PySide6.QtWidgets import QSpacerItem, QSizePolicy
-
         msgbox = QMessageBox(self)
         msgbox.setWindowTitle(f"About {APP_NAME}")
         msgbox.setText(
@@ -614,6 +619,10 @@ class MainWindow(QMainWindow):
         """Toggle attribute visibility in MCD."""
         self._mcd_canvas.set_show_attributes(checked)
 
+    def _on_toggle_grid(self, checked: bool):
+        """Toggle the background grid in MCD."""
+        self._mcd_canvas.set_show_grid(checked)
+
     def _on_link_style_changed(self, style: str):
         """Change link style in MCD."""
         # Update checkmarks
@@ -625,8 +634,6 @@ class MainWindow(QMainWindow):
 
     def _on_diagram_colors(self):
         """Show diagram colors dialog."""
-        from .dialogs.color_settings_dialog import ColorSettingsDialog
-
         dialog = ColorSettingsDialog(self._project, parent=self)
         if dialog.exec():
             dialog.apply_to_project()
@@ -1,17 +1,46 @@
+from contextlib import contextmanager
+from functools import partial
+
 from PySide6.QtWidgets import (
-    QGraphicsView, QGraphicsScene, QMenu, QMessageBox
+    QApplication, QGraphicsView, QGraphicsScene, QGraphicsItem, QMenu, QMessageBox
+)
+from PySide6.QtCore import Qt, Signal, QPointF, QRectF, QTimer
+from PySide6.QtGui import (
+    QPainter, QAction, QImage, QColor, QPixmap, QPixmapCache, QSurfaceFormat,
+    QTransform
 )
-from PySide6.QtCore import Qt, Signal, QPointF, QMarginsF, QRectF
-from PySide6.QtGui import QPainter, QAction, QImage, QColor
-from PySide6.QtSvg import QSvgGenerator
-from PySide6.QtGui import QPageSize, QPageLayout
-from PySide6.QtCore import QSizeF
 
 from ..models.project import Project
 from ..models.entity import Entity
 from ..models.association import Association
 from ..models.link import Link
-from .mcd_items import EntityItem, AssociationItem, LinkItem
+from .mcd_items import (
+    EntityItem, AssociationItem, LinkItem, deferred_link_updates, set_item_colors
+)
+from .dialogs.entity_dialog import EntityDialog
+from .dialogs.association_dialog import AssociationDialog
+from .dialogs.link_dialog import LinkDialog
+from .scene_export import build_scene, render_pdf, render_svg
+from .spatial import QuadTree
+
+
+class _RootItem(QGraphicsItem):
+    """Invisible parent of all diagram items.
+
+    Lets a rebuild attach the whole diagram to the scene with one addItem
+    call. It has no contents and an empty bounding rect, so it is never
+    painted, hit or counted in itemsBoundingRect().
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.setFlag(QGraphicsItem.ItemHasNoContents)
+
+    def boundingRect(self) -> QRectF:
+        return QRectF()
+
+    def paint(self, painter, option, widget=None):
+        pass
 
 
 class MCDCanvas(QGraphicsView):
@@ -26,139 +55,611 @@ class MCDCanvas(QGraphicsView):
     ZOOM_MAX = 4.0   # 400%
     ZOOM_STEP = 1.2  # 20% per step
 
+    # Delay (ms) used to coalesce bursts of modifications into one signal;
+    # 0 collapses everything done within one event loop iteration
+    MODIFIED_DELAY = 0
+
+    # Below this scale, the diagram is painted from a cached pixmap
+    LOD_CACHE_ZOOM = 0.35
+
+    # Above either limit (viewport pixels / entities + associations), items
+    # are painted with reduced graphics: no antialiasing or rounded corners
+    REDUCED_GRAPHICS_PIXELS = 6_000_000
+    REDUCED_GRAPHICS_ITEMS = 200
+
+    # Above this many entities + associations, repainting the whole viewport
+    # is cheaper than tracking dirty regions (see _update_viewport_update_mode)
+    FULL_UPDATE_ITEMS = 500
+
+    # Size (KB) of the shared pixmap cache holding the item caches; Qt's
+    # default (10 MB) evicts them when many items are visible at high zoom
+    PIXMAP_CACHE_LIMIT = 40960
+
+    # Background grid: cell size and the size of the cached tile (scene units)
+    GRID_SIZE = 20
+    GRID_TILE_SIZE = 200
+    GRID_COLOR = "#E0E0E0"
+
+    # Scene extent (x, y, width, height)
+    SCENE_RECT = (-2000, -2000, 4000, 4000)
+
+    # Rendering: composite the viewport with OpenGL instead of the raster engine.
+    # Off by default since it needs a working OpenGL driver (see main.py --opengl).
+    USE_OPENGL = False
+
     def __init__(self, project: Project, parent=None):
         super().__init__(parent)
         self._project = project
         self._scene = QGraphicsScene(self)
+        # Items move constantly while editing; hit-testing goes through our
+        # own quadtree, so skip Qt's BSP index and its rebuilds on every move.
+        self._scene.setItemIndexMethod(QGraphicsScene.NoIndex)
         self.setScene(self._scene)
 
+        # Parent of all diagram items (recreated on each rebuild)
+        self._root = _RootItem()
+        self._scene.addItem(self._root)
+
         # Item tracking
         self._entity_items: dict[str, EntityItem] = {}
         self._association_items: dict[str, AssociationItem] = {}
         self._link_items: dict[str, LinkItem] = {}
 
+        # Link ids per entity/association id, for deletions without project scans
+        self._links_by_entity: dict[str, set[str]] = {}
+        self._links_by_assoc: dict[str, set[str]] = {}
+
+        # Spatial index of entity/association items for hit-testing
+        self._qtree = QuadTree(*self.SCENE_RECT)
+
         # Display options
         self._show_attributes = True
         self._link_style = "curved"  # "curved", "orthogonal", "straight"
+        self._show_grid = False
+        self._reduced_graphics = False
+
+        # Grid tile, rendered once and tiled over the background
+        self._grid_tile: QPixmap | None = None
 
         # Zoom tracking
         self._zoom_level = 1.0
 
-        # Track item positions for move detection
-        self._drag_start_positions: dict[str, QPointF] = {}
+        # Wheel rotation (in eighths of a degree) not applied yet; folded
+        # into one zoom change
+        self._pending_zoom_delta = 0
+        self._zoom_timer = QTimer(self)
+        self._zoom_timer.setSingleShot(True)
+        self._zoom_timer.setInterval(0)
+        self._zoom_timer.timeout.connect(self._apply_pending_zoom)
+
+        # Inverse of viewportTransform(), see _map_to_scene()
+        self._scene_transform: QTransform | None = None
+
+        # Track item positions (x, y) for move detection
+        self._drag_start_positions: dict[str, tuple[float, float]] = {}
+
+        # Cached scene.itemsBoundingRect(), see _items_bounding_rect()
+        self._items_rect: QRectF | None = None
+
+        # Pre-rendered diagram used when zoomed far out
+        self._lod_pixmap: QPixmap | None = None
+        self._lod_rect = QRectF()
+        self._lod_scale = 0.0
+
+        # Uncached copy of the diagram, built once and rendered by every export
+        self._export_copy: QGraphicsScene | None = None
+
+        # Per item type handlers for double-click
+        self._edit_handlers = {
+            EntityItem: self._edit_entity,
+            AssociationItem: self._edit_association,
+            LinkItem: self._edit_link,
+        }
 
         self._setup_view()
         self._context_pos = QPointF(0, 0)
 
+        # Context menus are built once; their actions apply to _menu_target
+        self._menu_target = None
+        self._context_menus = {
+            type(None): self._build_empty_menu(),
+            EntityItem: self._build_entity_menu(),
+            AssociationItem: self._build_association_menu(),
+            LinkItem: self._build_link_menu(),
+        }
+
+        # Trailing-edge timer behind modified, see _schedule_modified()
+        self._modified_timer = QTimer(self)
+        self._modified_timer.setSingleShot(True)
+        self._modified_timer.setInterval(self.MODIFIED_DELAY)
+        self._modified_timer.timeout.connect(self.modified.emit)
+        self._scene.selectionChanged.connect(self._invalidate_lod_cache)
+
     def _setup_view(self):
         """Configure the view settings."""
-        self.setRenderHint(QPainter.Antialiasing)
+        # Antialiasing is enabled per item (curves only), not for the whole view
         self.setRenderHint(QPainter.SmoothPixmapTransform)
-        self.setViewportUpdateMode(QGraphicsView.FullViewportUpdate)
+        self.setOptimizationFlag(QGraphicsView.DontAdjustForAntialiasing, True)
+        # Items set the pen, brush, font and hints they draw with themselves
+        # (links put back the antialiasing hint they change), so the view
+        # need not save and restore the painter around each of them
+        self.setOptimizationFlag(QGraphicsView.DontSavePainterState, True)
+        # Items are painted from DeviceCoordinateCache pixmaps (see
+        # _make_entity_item), which live in QPixmapCache
+        QPixmapCache.setCacheLimit(max(QPixmapCache.cacheLimit(), self.PIXMAP_CACHE_LIMIT))
+        if self.USE_OPENGL:
+            self._setup_opengl_viewport()
+        # Repaint only the dirty regions; large diagrams switch back to full
+        # viewport updates in _update_viewport_update_mode()
+        self.setViewportUpdateMode(QGraphicsView.SmartViewportUpdate)
         self.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
         self.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
         self.setDragMode(QGraphicsView.RubberBandDrag)
+        # Zoom around the cursor when it is over the view (else the center)
+        self.setTransformationAnchor(QGraphicsView.AnchorUnderMouse)
         self.setContextMenuPolicy(Qt.CustomContextMenu)
         self.customContextMenuRequested.connect(self._show_context_menu)
 
         # Set scene rect
-        self._scene.setSceneRect(-2000, -2000, 4000, 4000)
+        self._scene.setSceneRect(*self.SCENE_RECT)
+
+    def _setup_opengl_viewport(self) -> bool:
+        """Replace the raster viewport with a multisampled OpenGL viewport."""
+        try:
+            from PySide6.QtOpenGLWidgets import QOpenGLWidget
+        except ImportError:
+            return False
+
+        gl_widget = QOpenGLWidget()
+        fmt = QSurfaceFormat()
+        fmt.setSamples(4)
+        gl_widget.setFormat(fmt)
+        self.setViewport(gl_widget)
+        return True
+
+    def _schedule_modified(self):
+        """Emit modified once a burst of changes has settled.
+
+        The canvas itself is updated right away; only the (comparatively
+        expensive) listeners of the modified signal are deferred.
+        """
+        self._invalidate_items_rect()
+        self._invalidate_lod_cache()
+        self._modified_timer.start()
+
+    def flush_modified(self):
+        """Emit a pending modified signal immediately."""
+        if self._modified_timer.isActive():
+            self._modified_timer.stop()
+            self.modified.emit()
+
+    def _items_bounding_rect(self) -> QRectF:
+        """Get the bounding rect of all items, computed once per change."""
+        if self._items_rect is None:
+            self._items_rect = self._scene.itemsBoundingRect()
+        # Callers adjust the rect in place, so hand out a copy
+        return QRectF(self._items_rect)
+
+    def _invalidate_items_rect(self):
+        """Forget the cached items bounding rect after items moved or changed."""
+        self._items_rect = None
+
+    def _invalidate_lod_cache(self):
+        """Drop the low-zoom diagram pixmap so it is re-rendered on next paint.
+
+        The copy of the diagram used for exports depends on the same state,
+        so it goes too.
+        """
+        self._export_copy = None
+        if self._lod_pixmap is not None:
+            self._lod_pixmap = None
+            self.viewport().update()
+
+    def _render_lod_pixmap(self, scale: float):
+        """Render the whole diagram into a pixmap at the given view scale."""
+        rect = self._items_bounding_rect()
+        ratio = self.devicePixelRatioF()
+        width = max(1, int(rect.width() * scale * ratio))
+        height = max(1, int(rect.height() * scale * ratio))
+
+        pixmap = QPixmap(width, height)
+        pixmap.fill(Qt.transparent)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.SmoothPixmapTransform)
+        self._scene.render(painter, QRectF(0, 0, width, height), rect)
+        painter.end()
+
+        self._lod_pixmap = pixmap
+        self._lod_rect = rect
+        self._lod_scale = scale
+
+    def _update_reduced_graphics(self):
+        """Switch reduced graphics on or off for the current size and item count."""
+        viewport = self.viewport()
+        reduced = (
+            viewport.width() * viewport.height() > self.REDUCED_GRAPHICS_PIXELS
+            or len(self._entity_items) + len(self._association_items) > self.REDUCED_GRAPHICS_ITEMS
+        )
+        if reduced == self._reduced_graphics:
+            return
+        self._reduced_graphics = reduced
+        EntityItem.reduced_graphics = reduced
+        AssociationItem.reduced_graphics = reduced
+        LinkItem.reduced_graphics = reduced
+        # Drop the items' cached pixmaps, painted with the previous setting
+        for item in self._entity_items.values():
+            item.update()
+        for item in self._association_items.values():
+            item.update()
+        viewport.update()
+
+    def set_viewport_update_mode(self, mode: QGraphicsView.ViewportUpdateMode):
+        """Set how the viewport is repainted when the scene changes."""
+        if self.viewportUpdateMode() != mode:
+            self.setViewportUpdateMode(mode)
+
+    def _update_viewport_update_mode(self):
+        """Pick full or smart viewport updates for the current item count."""
+        count = len(self._entity_items) + len(self._association_items)
+        if count > self.FULL_UPDATE_ITEMS:
+            self.set_viewport_update_mode(QGraphicsView.FullViewportUpdate)
+        else:
+            self.set_viewport_update_mode(QGraphicsView.SmartViewportUpdate)
+
+    def resizeEvent(self, event):
+        """Re-evaluate reduced graphics when the viewport size changes."""
+        super().resizeEvent(event)
+        self._scene_transform = None
+        self._update_reduced_graphics()
+
+    def scrollContentsBy(self, dx: int, dy: int):
+        """Forget the cached scene transform when the view scrolls."""
+        super().scrollContentsBy(dx, dy)
+        self._scene_transform = None
+
+    def _map_to_scene(self, pos) -> QPointF:
+        """Map a viewport position to scene coordinates.
+
+        Like mapToScene(), but the inverted view transform is kept until the
+        view is scrolled, zoomed or resized instead of being inverted again
+        for every call.
+        """
+        if self._scene_transform is None:
+            self._scene_transform = self.viewportTransform().inverted()[0]
+        return self._scene_transform.map(QPointF(pos))
+
+    def _render_grid_tile(self) -> QPixmap:
+        """Render one tile of the background grid."""
+        size = self.GRID_TILE_SIZE
+        ratio = self.devicePixelRatioF()
+        tile = QPixmap(int(size * ratio), int(size * ratio))
+        tile.setDevicePixelRatio(ratio)
+        tile.fill(Qt.white)
+
+        painter = QPainter(tile)
+        painter.setPen(QColor(self.GRID_COLOR))
+        for offset in range(0, size, self.GRID_SIZE):
+            painter.drawLine(offset, 0, offset, size)
+            painter.drawLine(0, offset, size, offset)
+        painter.end()
+        return tile
+
+    def drawBackground(self, painter, rect):
+        """Draw the background, tiling the cached grid pixmap if enabled."""
+        super().drawBackground(painter, rect)
+        if not self._show_grid:
+            return
+
+        if self._grid_tile is None or self._grid_tile.devicePixelRatio() != self.devicePixelRatioF():
+            self._grid_tile = self._render_grid_tile()
+
+        # Anchor the tiles on the scene origin so the grid does not follow panning
+        size = self.GRID_TILE_SIZE
+        painter.drawTiledPixmap(rect, self._grid_tile, QPointF(rect.left() % size, rect.top() % size))
+
+    def paintEvent(self, event):
+        """Paint the view, blitting a cached pixmap when zoomed far out."""
+        scale = self.transform().m11()
+        # Paint live while a mouse button is held (dragging, rubber band)
+        if scale >= self.LOD_CACHE_ZOOM or QApplication.mouseButtons() != Qt.NoButton:
+            super().paintEvent(event)
+            return
+
+        if self._lod_pixmap is None or self._lod_scale != scale:
+            self._render_lod_pixmap(scale)
+
+        painter = QPainter(self.viewport())
+        painter.setRenderHint(QPainter.SmoothPixmapTransform)
+        painter.setWorldTransform(self.viewportTransform())
+        exposed = self.mapToScene(event.rect()).boundingRect()
+        self.drawBackground(painter, exposed)
+        painter.drawPixmap(self._lod_rect, self._lod_pixmap, QRectF(self._lod_pixmap.rect()))
+        self.drawForeground(painter, exposed)
+        painter.end()
 
     def set_project(self, project: Project):
         """Set a new project and refresh the canvas."""
+        # A change still pending belonged to the previous project
+        self._modified_timer.stop()
         self._project = project
         self.refresh()
 
+    @contextmanager
+    def _suspend_updates(self):
+        """Suspend repaints and scene signals for a bulk change, then repaint once."""
+        self.setUpdatesEnabled(False)
+        self._scene.blockSignals(True)
+        try:
+            yield
+        finally:
+            self._scene.blockSignals(False)
+            self.setUpdatesEnabled(True)
+            self.viewport().update()
+
     def refresh(self):
         """Refresh the canvas from the project data."""
+        self._invalidate_items_rect()
+        self._invalidate_lod_cache()
+        with self._suspend_updates():
+            self._sync_items()
+        self._update_reduced_graphics()
+        self._update_viewport_update_mode()
+
+    def _sync_items(self):
+        """Bring the items in line with the project data.
+
+        Items whose model object is still in the project are kept and
+        refreshed (which is cheap unless their content changed); only added,
+        removed or replaced objects get their items created or dropped. When
+        nothing can be kept (e.g. another project was loaded), everything is
+        rebuilt in one go.
+        """
+        entities = {entity.id: entity for entity in self._project.get_all_entities()}
+        associations = {assoc.id: assoc for assoc in self._project.get_all_associations()}
+        links = {link.id: link for link in self._project.get_all_links()}
+
+        stale_entities = [
+            entity_id for entity_id, item in self._entity_items.items()
+            if entities.get(entity_id) is not item.entity
+        ]
+        stale_assocs = [
+            assoc_id for assoc_id, item in self._association_items.items()
+            if associations.get(assoc_id) is not item.association
+        ]
+        if (len(stale_entities) == len(self._entity_items)
+                and len(stale_assocs) == len(self._association_items)):
+            self._rebuild_items()
+            return
+
+        # Drop items whose model object is gone or was replaced
+        removed = []
+        for entity_id in stale_entities:
+            removed.extend(self._drop_entity(entity_id))
+        for assoc_id in stale_assocs:
+            removed.extend(self._drop_association(assoc_id))
+        for link_id, item in list(self._link_items.items()):
+            link = links.get(link_id)
+            if (link is not item.link
+                    or self._entity_items.get(link.entity_id) is not item.entity_item
+                    or self._association_items.get(link.association_id) is not item.association_item):
+                removed.append(self._drop_link(link_id))
+        for item in removed:
+            self._scene.removeItem(item)
+
+        # Refresh kept items and create the missing ones. Kept links are
+        # updated once at the end, along with any moved with their ends.
+        with deferred_link_updates() as pending_links:
+            pending_links.update(self._link_items.values())
+            for entity_id, entity in entities.items():
+                item = self._entity_items.get(entity_id)
+                if item is None:
+                    self._entity_items[entity_id] = self._make_entity_item(entity)
+                else:
+                    self._sync_item(entity_id, item, entity.x, entity.y)
+            for assoc_id, assoc in associations.items():
+                item = self._association_items.get(assoc_id)
+                if item is None:
+                    self._association_items[assoc_id] = self._make_association_item(assoc)
+                else:
+                    self._sync_item(assoc_id, item, assoc.x, assoc.y)
+            for link_id, link in links.items():
+                if (link_id not in self._link_items
+                        and link.entity_id in self._entity_items
+                        and link.association_id in self._association_items):
+                    self._link_items[link_id] = self._make_link_item(link)
+
+    def _sync_item(self, item_id: str, item, x: float, y: float):
+        """Refresh a kept entity/association item (its links are left to the caller)."""
+        if item.pos() != QPointF(x, y):
+            item.setPos(x, y)
+        item.refresh(update_links=False)
+        self._index_item(item_id, item)
+
+    def _rebuild_items(self):
+        """Recreate all items from the project data."""
         self._scene.clear()
-        self._entity_items.clear()
-        self._association_items.clear()
-        self._link_items.clear()
-
-        # Create entity items
-        for entity in self._project.get_all_entities():
-            item = EntityItem(entity)
-            self._scene.addItem(item)
-            self._entity_items[entity.id] = item
-
-        # Create association items
-        for assoc in self._project.get_all_associations():
-            item = AssociationItem(assoc)
-            self._scene.addItem(item)
-            self._association_items[assoc.id] = item
-
-        # Create link items
-        for link in self._project.get_all_links():
-            entity_item = self._entity_items.get(link.entity_id)
-            assoc_item = self._association_items.get(link.association_id)
-            if entity_item and assoc_item:
-                item = LinkItem(link, entity_item, assoc_item)
-                self._scene.addItem(item)
-                self._link_items[link.id] = item
+        self._links_by_entity.clear()
+        self._links_by_assoc.clear()
+        self._qtree.clear()
+
+        # Build the items under a detached root, then add them all at once
+        self._root = _RootItem()
+
+        self._entity_items = {
+            entity.id: self._make_entity_item(entity)
+            for entity in self._project.get_all_entities()
+        }
+        self._association_items = {
+            assoc.id: self._make_association_item(assoc)
+            for assoc in self._project.get_all_associations()
+        }
+        # Links whose entity or association is missing are skipped
+        self._link_items = {
+            link.id: self._make_link_item(link)
+            for link in self._project.get_all_links()
+            if link.entity_id in self._entity_items
+            and link.association_id in self._association_items
+        }
+
+        self._scene.addItem(self._root)
+
+    # Entity and association items are painted from a per-item pixmap cache
+    # (they change far less often than the view is repainted); links change
+    # geometry whenever an endpoint moves and are not cached.
+
+    def _make_entity_item(self, entity: Entity) -> EntityItem:
+        """Create an entity item under the root item and index it."""
+        item = EntityItem(entity)
+        item.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
+        item.setParentItem(self._root)
+        self._index_item(entity.id, item)
+        return item
+
+    def _make_association_item(self, assoc: Association) -> AssociationItem:
+        """Create an association item under the root item and index it."""
+        item = AssociationItem(assoc)
+        item.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
+        item.setParentItem(self._root)
+        self._index_item(assoc.id, item)
+        return item
+
+    def _make_link_item(self, link: Link) -> LinkItem:
+        """Create a link item between existing entity/association items."""
+        item = LinkItem(
+            link,
+            self._entity_items[link.entity_id],
+            self._association_items[link.association_id]
+        )
+        item.setParentItem(self._root)
+        self._index_link(link)
+        return item
+
+    def _index_link(self, link: Link):
+        """Record a link in the per-entity and per-association link index."""
+        self._links_by_entity.setdefault(link.entity_id, set()).add(link.id)
+        self._links_by_assoc.setdefault(link.association_id, set()).add(link.id)
+
+    def _unindex_link(self, link: Link):
+        """Remove a link from the per-entity and per-association link index."""
+        self._links_by_entity.get(link.entity_id, set()).discard(link.id)
+        self._links_by_assoc.get(link.association_id, set()).discard(link.id)
+
+    def _drop_link(self, link_id: str) -> LinkItem | None:
+        """Detach a link item from its endpoints and the canvas indexes.
+
+        The item is returned for the caller to remove from the scene (so
+        bulk deletions can do that in one pass); the project is untouched.
+        """
+        item = self._link_items.pop(link_id, None)
+        if item is not None:
+            item.cleanup()
+            self._unindex_link(item.link)
+        return item
+
+    def _drop_entity(self, entity_id: str) -> list:
+        """Detach an entity item and its links; returns the items to remove."""
+        dropped = [self._drop_link(link_id) for link_id in self._links_by_entity.pop(entity_id, ())]
+        dropped.append(self._entity_items.pop(entity_id))
+        self._qtree.remove(entity_id)
+        return [item for item in dropped if item is not None]
+
+    def _drop_association(self, assoc_id: str) -> list:
+        """Detach an association item and its links; returns the items to remove."""
+        dropped = [self._drop_link(link_id) for link_id in self._links_by_assoc.pop(assoc_id, ())]
+        dropped.append(self._association_items.pop(assoc_id))
+        self._qtree.remove(assoc_id)
+        return [item for item in dropped if item is not None]
+
+    def _index_item(self, item_id: str, item):
+        """Insert or update an entity/association item in the spatial index."""
+        rect = item.sceneBoundingRect()
+        self._qtree.insert(item_id, (rect.x(), rect.y(), rect.width(), rect.height()))
+
+    def _item_at(self, pos):
+        """Get the topmost item at a viewport position.
+
+        Entities and associations are resolved through the spatial index;
+        links (and their labels) fall back to the scene lookup, reusing the
+        already mapped scene position.
+        """
+        scene_pos = self._map_to_scene(pos)
+        for item_id in reversed(self._qtree.query_point(scene_pos.x(), scene_pos.y())):
+            item = self._entity_items.get(item_id) or self._association_items.get(item_id)
+            if item is not None and item.contains(item.mapFromScene(scene_pos)):
+                return item
+        return self._scene.itemAt(scene_pos, self.viewportTransform())
 
     def _show_context_menu(self, pos):
         """Show context menu at the given position."""
-        self._context_pos = self.mapToScene(pos)
-        item = self.itemAt(pos)
-
-        menu = QMenu(self)
+        self._context_pos = self._map_to_scene(pos)
+        item = self._item_at(pos)
 
-        if item is None:
-            # Context menu for empty space
-            add_entity = menu.addAction("Add Entity")
-            add_entity.triggered.connect(self._add_entity)
-
-            add_assoc = menu.addAction("Add Association")
-            add_assoc.triggered.connect(self._add_association)
+        menu = self._context_menus.get(type(item))
+        if menu is None:
+            return
+        self._menu_target = item
+        try:
+            menu.exec(self.mapToGlobal(pos))
+        finally:
+            self._menu_target = None
 
-        elif isinstance(item, EntityItem):
-            edit_action = menu.addAction("Edit Entity")
-            edit_action.triggered.connect(lambda: self._edit_entity(item))
+    def _on_menu_target(self, handler):
+        """Run a context menu handler on the item the menu was opened for."""
+        if self._menu_target is not None:
+            handler(self._menu_target)
 
-            delete_action = menu.addAction("Delete Entity")
-            delete_action.triggered.connect(lambda: self._delete_entity(item))
+    def _build_empty_menu(self) -> QMenu:
+        """Build the context menu for empty space."""
+        menu = QMenu(self)
+        add_entity = menu.addAction("Add Entity")
+        add_entity.triggered.connect(self._add_entity)
 
-            menu.addSeparator()
+        add_assoc = menu.addAction("Add Association")
+        add_assoc.triggered.connect(self._add_association)
+        return menu
 
-            add_link = menu.addAction("Add Link to Association...")
-            add_link.triggered.connect(lambda: self._add_link_from_entity(item))
+    def _build_entity_menu(self) -> QMenu:
+        """Build the context menu for an entity."""
+        menu = QMenu(self)
+        edit_action = menu.addAction("Edit Entity")
+        edit_action.triggered.connect(partial(self._on_menu_target, self._edit_entity))
 
-        elif isinstance(item, AssociationItem):
-            edit_action = menu.addAction("Edit Association")
-            edit_action.triggered.connect(lambda: self._edit_association(item))
+        delete_action = menu.addAction("Delete Entity")
+        delete_action.triggered.connect(partial(self._on_menu_target, self._delete_entity))
 
-            delete_action = menu.addAction("Delete Association")
-            delete_action.triggered.connect(lambda: self._delete_association(item))
+        menu.addSeparator()
 
-            menu.addSeparator()
+        add_link = menu.addAction("Add Link to Association...")
+        add_link.triggered.connect(partial(self._on_menu_target, self._add_link_from_entity))
+        return menu
 
-            add_link = menu.addAction("Add Link to Entity...")
-            add_link.triggered.connect(lambda: self._add_link_from_association(item))
+    def _build_association_menu(self) -> QMenu:
+        """Build the context menu for an association."""
+        menu = QMenu(self)
+        edit_action = menu.addAction("Edit Association")
+        edit_action.triggered.connect(partial(self._on_menu_target, self._edit_association))
 
-        elif isinstance(item, LinkItem):
-            edit_action = menu.addAction("Edit Link")
-            edit_action.triggered.connect(lambda: self._edit_link(item))
+        delete_action = menu.addAction("Delete Association")
+        delete_action.triggered.connect(partial(self._on_menu_target, self._delete_association))
 
-            delete_action = menu.addAction("Delete Link")
-            delete_action.triggered.connect(lambda: self._delete_link(item))
+        menu.addSeparator()
 
-        # Handle clicking on child items (like cardinality labels)
-        elif item.parentItem():
-            parent = item.parentItem()
-            if isinstance(parent, LinkItem):
-                edit_action = menu.addAction("Edit Link")
-                edit_action.triggered.connect(lambda: self._edit_link(parent))
+        add_link = menu.addAction("Add Link to Entity...")
+        add_link.triggered.connect(partial(self._on_menu_target, self._add_link_from_association))
+        return menu
 
-                delete_action = menu.addAction("Delete Link")
-                delete_action.triggered.connect(lambda: self._delete_link(parent))
+    def _build_link_menu(self) -> QMenu:
+        """Build the context menu for a link."""
+        menu = QMenu(self)
+        edit_action = menu.addAction("Edit Link")
+        edit_action.triggered.connect(partial(self._on_menu_target, self._edit_link))
 
-        menu.exec(self.mapToGlobal(pos))
+        delete_action = menu.addAction("Delete Link")
+        delete_action.triggered.connect(partial(self._on_menu_target, self._delete_link))
+        return menu
 
     def _add_entity(self):
         """Add a new entity at the context menu position."""
-        from .dialogs.entity_dialog import EntityDialog
-
         dialog = EntityDialog(parent=self)
         if dialog.exec():
             entity = dialog.get_entity()
@@ -167,15 +668,11 @@ class MCDCanvas(QGraphicsView):
                 entity.y = self._context_pos.y()
                 self._project.add_entity(entity)
 
-                item = EntityItem(entity)
-                self._scene.addItem(item)
-                self._entity_items[entity.id] = item
-                self.modified.emit()
+                self._entity_items[entity.id] = self._make_entity_item(entity)
+                self._schedule_modified()
 
     def _add_association(self):
         """Add a new association at the context menu position."""
-        from .dialogs.association_dialog import AssociationDialog
-
         dialog = AssociationDialog(parent=self)
         if dialog.exec():
             assoc = dialog.get_association()
@@ -184,20 +681,17 @@ class MCDCanvas(QGraphicsView):
                 assoc.y = self._context_pos.y()
                 self._project.add_association(assoc)
 
-                item = AssociationItem(assoc)
-                self._scene.addItem(item)
-                self._association_items[assoc.id] = item
-                self.modified.emit()
+                self._association_items[assoc.id] = self._make_association_item(assoc)
+                self._schedule_modified()
 
     def _edit_entity(self, item: EntityItem):
         """Edit an existing entity."""
-        from .dialogs.entity_dialog import EntityDialog
-
         dialog = EntityDialog(entity=item.entity, parent=self)
         if dialog.exec():
             dialog.get_entity()  # Updates the entity in place
             item.refresh()
-            self.modified.emit()
+            self._index_item(item.entity.id, item)
+            self._schedule_modified()
 
     def _delete_entity(self, item: EntityItem):
         """Delete an entity."""
@@ -209,30 +703,20 @@ class MCDCanvas(QGraphicsView):
         )
 
         if result == QMessageBox.Yes:
-            # Remove links first
-            links_to_remove = self._project.get_links_for_entity(item.entity.id)
-            for link in links_to_remove:
-                link_item = self._link_items.get(link.id)
-                if link_item:
-                    link_item.cleanup()
-                    self._scene.removeItem(link_item)
-                    del self._link_items[link.id]
-
-            # Remove entity
+            # Remove the entity and its connected links
             self._project.remove_entity(item.entity.id)
-            self._scene.removeItem(item)
-            del self._entity_items[item.entity.id]
-            self.modified.emit()
+            for dropped in self._drop_entity(item.entity.id):
+                self._scene.removeItem(dropped)
+            self._schedule_modified()
 
     def _edit_association(self, item: AssociationItem):
         """Edit an existing association."""
-        from .dialogs.association_dialog import AssociationDialog
-
         dialog = AssociationDialog(association=item.association, parent=self)
         if dialog.exec():
             dialog.get_association()  # Updates the association in place
             item.refresh()
-            self.modified.emit()
+            self._index_item(item.association.id, item)
+            self._schedule_modified()
 
     def _delete_association(self, item: AssociationItem):
         """Delete an association."""
@@ -244,25 +728,14 @@ class MCDCanvas(QGraphicsView):
         )
 
         if result == QMessageBox.Yes:
-            # Remove links first
-            links_to_remove = self._project.get_links_for_association(item.association.id)
-            for link in links_to_remove:
-                link_item = self._link_items.get(link.id)
-                if link_item:
-                    link_item.cleanup()
-                    self._scene.removeItem(link_item)
-                    del self._link_items[link.id]
-
-            # Remove association
+            # Remove the association and its connected links
             self._project.remove_association(item.association.id)
-            self._scene.removeItem(item)
-            del self._association_items[item.association.id]
-            self.modified.emit()
+            for dropped in self._drop_association(item.association.id):
+                self._scene.removeItem(dropped)
+            self._schedule_modified()
 
     def _add_link_from_entity(self, entity_item: EntityItem):
         """Add a link from an entity to an association."""
-        from .dialogs.link_dialog import LinkDialog
-
         associations = self._project.get_all_associations()
         if not associations:
             QMessageBox.warning(
@@ -276,7 +749,7 @@ class MCDCanvas(QGraphicsView):
         dialog = LinkDialog(entities, associations, parent=self)
 
         # Set the entity in the dialog
-        index = dialog._entity_combo.findData(entity_item.entity.id)
+        index = dialog.index_of_entity(entity_item.entity.id)
         if index >= 0:
             dialog._entity_combo.setCurrentIndex(index)
 
@@ -287,8 +760,6 @@ class MCDCanvas(QGraphicsView):
 
     def _add_link_from_association(self, assoc_item: AssociationItem):
         """Add a link from an association to an entity."""
-        from .dialogs.link_dialog import LinkDialog
-
         entities = self._project.get_all_entities()
         if not entities:
             QMessageBox.warning(
@@ -301,7 +772,7 @@ class MCDCanvas(QGraphicsView):
         dialog = LinkDialog(entities, associations, parent=self)
 
         # Set the association in the dialog
-        index = dialog._assoc_combo.findData(assoc_item.association.id)
+        index = dialog.index_of_association(assoc_item.association.id)
         if index >= 0:
             dialog._assoc_combo.setCurrentIndex(index)
 
@@ -312,28 +783,31 @@ class MCDCanvas(QGraphicsView):
 
     def _create_link_item(self, link: Link):
         """Create a link item and add it to the scene."""
-        entity_item = self._entity_items.get(link.entity_id)
-        assoc_item = self._association_items.get(link.association_id)
-
-        if entity_item and assoc_item:
+        if link.entity_id in self._entity_items and link.association_id in self._association_items:
             self._project.add_link(link)
-            item = LinkItem(link, entity_item, assoc_item)
-            self._scene.addItem(item)
-            self._link_items[link.id] = item
-            self.modified.emit()
+            self._link_items[link.id] = self._make_link_item(link)
+            self._schedule_modified()
 
     def _edit_link(self, item: LinkItem):
         """Edit an existing link."""
-        from .dialogs.link_dialog import LinkDialog
-
         entities = self._project.get_all_entities()
         associations = self._project.get_all_associations()
 
-        dialog = LinkDialog(entities, associations, link=item.link, parent=self)
+        link = item.link
+        old_endpoints = (link.entity_id, link.association_id)
+        dialog = LinkDialog(entities, associations, link=link, parent=self)
         if dialog.exec():
+            self._unindex_link(link)
             dialog.get_link()  # Updates the link in place
-            item.update_position()
-            self.modified.emit()
+            if (link.entity_id, link.association_id) != old_endpoints:
+                # Reconnect the item to its new entity/association
+                item.cleanup()
+                self._scene.removeItem(item)
+                self._link_items[link.id] = self._make_link_item(link)
+            else:
+                self._index_link(link)
+                item.update_position()
+            self._schedule_modified()
 
     def _delete_link(self, item: LinkItem):
         """Delete a link."""
@@ -345,27 +819,28 @@ class MCDCanvas(QGraphicsView):
         )
 
         if result == QMessageBox.Yes:
-            item.cleanup()
             self._project.remove_link(item.link.id)
+            self._drop_link(item.link.id)
             self._scene.removeItem(item)
-            del self._link_items[item.link.id]
-            self.modified.emit()
+            self._schedule_modified()
 
     # Public API for toolbar actions
+    def visible_scene_rect(self) -> QRectF:
+        """Get the part of the scene currently shown in the viewport."""
+        return self.mapToScene(self.viewport().rect()).boundingRect()
+
     def add_entity_at_center(self):
         """Add entity at center of view."""
-        self._context_pos = self.mapToScene(self.viewport().rect().center())
+        self._context_pos = self.visible_scene_rect().center()
         self._add_entity()
 
     def add_association_at_center(self):
         """Add association at center of view."""
-        self._context_pos = self.mapToScene(self.viewport().rect().center())
+        self._context_pos = self.visible_scene_rect().center()
         self._add_association()
 
     def add_link(self):
         """Open dialog to add a link."""
-        from .dialogs.link_dialog import LinkDialog
-
         entities = self._project.get_all_entities()
         associations = self._project.get_all_associations()
 
@@ -398,40 +873,33 @@ class MCDCanvas(QGraphicsView):
         if result != QMessageBox.Yes:
             return
 
-        for item in selected:
-            if isinstance(item, EntityItem):
-                # Remove connected links first
-                links_to_remove = self._project.get_links_for_entity(item.entity.id)
-                for link in links_to_remove:
-                    link_item = self._link_items.get(link.id)
-                    if link_item:
-                        link_item.cleanup()
-                        self._scene.removeItem(link_item)
-                        del self._link_items[link.id]
-                self._project.remove_entity(item.entity.id)
+        # Detach everything first, then take the items off the scene in one pass
+        removed = []
+        entity_ids, assoc_ids, link_ids = [], [], []
+        with self._suspend_updates():
+            for item in selected:
+                if isinstance(item, EntityItem):
+                    entity_ids.append(item.entity.id)
+                    removed.extend(self._drop_entity(item.entity.id))
+
+                elif isinstance(item, AssociationItem):
+                    assoc_ids.append(item.association.id)
+                    removed.extend(self._drop_association(item.association.id))
+
+                elif isinstance(item, LinkItem):
+                    # May already be gone along with a selected entity/association
+                    if self._drop_link(item.link.id) is None:
+                        continue
+                    link_ids.append(item.link.id)
+                    removed.append(item)
+
+            # One pass over the project links instead of one per deleted item
+            self._project.remove_elements(entity_ids, assoc_ids, link_ids)
+
+            for item in removed:
                 self._scene.removeItem(item)
-                del self._entity_items[item.entity.id]
 
-            elif isinstance(item, AssociationItem):
-                # Remove connected links first
-                links_to_remove = self._project.get_links_for_association(item.association.id)
-                for link in links_to_remove:
-                    link_item = self._link_items.get(link.id)
-                    if link_item:
-                        link_item.cleanup()
-                        self._scene.removeItem(link_item)
-                        del self._link_items[link.id]
-                self._project.remove_association(item.association.id)
-                self._scene.removeItem(item)
-                del self._association_items[item.association.id]
-
-            elif isinstance(item, LinkItem):
-                item.cleanup()
-                self._project.remove_link(item.link.id)
-                self._scene.removeItem(item)
-                del self._link_items[item.link.id]
-
-        self.modified.emit()
+        self._schedule_modified()
 
     def keyPressEvent(self, event):
         """Handle key press events."""
@@ -444,22 +912,22 @@ class MCDCanvas(QGraphicsView):
         """Track item positions before potential drag."""
         self._drag_start_positions.clear()
 
-        # Track the item under cursor
-        item = self.itemAt(event.pos())
-        if isinstance(item, EntityItem):
-            self._drag_start_positions[item.entity.id] = QPointF(item.pos())
-        elif isinstance(item, AssociationItem):
-            self._drag_start_positions[item.association.id] = QPointF(item.pos())
-
-        # Also track already selected items
-        for sel_item in self._scene.selectedItems():
-            if isinstance(sel_item, EntityItem):
-                self._drag_start_positions[sel_item.entity.id] = QPointF(sel_item.pos())
-            elif isinstance(sel_item, AssociationItem):
-                self._drag_start_positions[sel_item.association.id] = QPointF(sel_item.pos())
+        # Track the item under cursor, and already selected items
+        for item in (self._item_at(event.pos()), *self._scene.selectedItems()):
+            if isinstance(item, EntityItem):
+                pos = item.pos()
+                self._drag_start_positions[item.entity.id] = (pos.x(), pos.y())
+            elif isinstance(item, AssociationItem):
+                pos = item.pos()
+                self._drag_start_positions[item.association.id] = (pos.x(), pos.y())
 
         super().mousePressEvent(event)
 
+    def mouseMoveEvent(self, event):
+        """Move dragged items, updating the links between them only once."""
+        with deferred_link_updates():
+            super().mouseMoveEvent(event)
+
     def mouseReleaseEvent(self, event):
         """Detect if items were moved and emit modified signal."""
         super().mouseReleaseEvent(event)
@@ -469,52 +937,44 @@ class MCDCanvas(QGraphicsView):
 
         # Check if any tracked items moved
         moved = False
-        for item in self._scene.items():
-            if isinstance(item, EntityItem):
-                item_id = item.entity.id
-                if item_id in self._drag_start_positions:
-                    start_pos = self._drag_start_positions[item_id]
-                    if item.pos().x() != start_pos.x() or item.pos().y() != start_pos.y():
-                        moved = True
-                        break
-            elif isinstance(item, AssociationItem):
-                item_id = item.association.id
-                if item_id in self._drag_start_positions:
-                    start_pos = self._drag_start_positions[item_id]
-                    if item.pos().x() != start_pos.x() or item.pos().y() != start_pos.y():
-                        moved = True
-                        break
+        for item_id, start_pos in self._drag_start_positions.items():
+            item = self._entity_items.get(item_id) or self._association_items.get(item_id)
+            if item is not None:
+                pos = item.pos()
+                if (pos.x(), pos.y()) != start_pos:
+                    moved = True
+                    break
 
         if moved:
-            self.modified.emit()
+            # Keep the model and the spatial index in sync with the dragged
+            # items (items without links do not report position changes)
+            for item_id in self._drag_start_positions:
+                item = self._entity_items.get(item_id) or self._association_items.get(item_id)
+                if item is not None:
+                    item.store_position()
+                    self._index_item(item_id, item)
+            self._schedule_modified()
 
         self._drag_start_positions.clear()
 
     def mouseDoubleClickEvent(self, event):
         """Handle double-click to edit items."""
-        item = self.itemAt(event.pos())
-        if isinstance(item, EntityItem):
-            self._edit_entity(item)
-        elif isinstance(item, AssociationItem):
-            self._edit_association(item)
-        elif isinstance(item, LinkItem):
-            self._edit_link(item)
-        elif item and item.parentItem():
-            # Handle clicking on child items (like cardinality labels)
-            parent = item.parentItem()
-            if isinstance(parent, LinkItem):
-                self._edit_link(parent)
-        else:
+        item = self._item_at(event.pos())
+        handler = self._edit_handlers.get(type(item))
+        if handler is not None:
+            handler(item)
+        elif item is None:
             super().mouseDoubleClickEvent(event)
 
     def wheelEvent(self, event):
         """Handle mouse wheel for zooming."""
         if event.modifiers() & Qt.ControlModifier:
-            # Zoom with Ctrl + scroll
-            if event.angleDelta().y() > 0:
-                self.zoom_in()
-            else:
-                self.zoom_out()
+            # Zoom with Ctrl + scroll; rotation arriving in one burst is
+            # accumulated and applied once the event queue is drained
+            delta = event.angleDelta().y()
+            if delta:
+                self._pending_zoom_delta += delta
+                self._zoom_timer.start()
         else:
             super().wheelEvent(event)
 
@@ -537,7 +997,7 @@ class MCDCanvas(QGraphicsView):
     def zoom_fit(self):
         """Fit the diagram to the view."""
         # Get bounding rect of all items
-        items_rect = self._scene.itemsBoundingRect()
+        items_rect = self._items_bounding_rect()
         if items_rect.isEmpty():
             self.zoom_reset()
             return
@@ -548,6 +1008,7 @@ class MCDCanvas(QGraphicsView):
 
         # Fit to view
         self.fitInView(items_rect, Qt.KeepAspectRatio)
+        self._scene_transform = None
 
         # Calculate and store the new zoom level
         view_rect = self.viewport().rect()
@@ -560,39 +1021,61 @@ class MCDCanvas(QGraphicsView):
         self._zoom_level = new_zoom
         self.zoom_changed.emit(int(self._zoom_level * 100))
 
+    def _apply_pending_zoom(self):
+        """Apply the accumulated wheel zoom, clamped to the zoom limits.
+
+        A wheel notch (120) is one zoom step; high-resolution wheels and
+        touchpads send smaller deltas that zoom by a fraction of a step.
+        """
+        steps = self._pending_zoom_delta / 120
+        self._pending_zoom_delta = 0
+        new_zoom = self._zoom_level * self.ZOOM_STEP ** steps
+        new_zoom = max(self.ZOOM_MIN, min(self.ZOOM_MAX, new_zoom))
+        if new_zoom != self._zoom_level:
+            self._apply_zoom(new_zoom)
+
     def _apply_zoom(self, new_zoom: float):
         """Apply a new zoom level."""
-        factor = new_zoom / self._zoom_level
         self._zoom_level = new_zoom
-        self.scale(factor, factor)
+        # Set the absolute scale rather than scaling by the ratio, so rounding
+        # errors do not accumulate over many zoom steps
+        self.setTransform(QTransform.fromScale(new_zoom, new_zoom))
+        self._scene_transform = None
         self.zoom_changed.emit(int(self._zoom_level * 100))
 
     def get_zoom_level(self) -> int:
         """Get current zoom level as percentage."""
         return int(self._zoom_level * 100)
 
+    def _export_rect(self) -> QRectF:
+        """Get the scene area covered by exports: all items plus a margin."""
+        items_rect = self._items_bounding_rect()
+        if not items_rect.isEmpty():
+            margin = 20
+            items_rect.adjust(-margin, -margin, margin, margin)
+        return items_rect
+
+    def _export_scene(self) -> QGraphicsScene:
+        """Get a copy of the diagram to export, without item caches.
+
+        The canvas items paint from their pixmap caches, which would end up
+        in vector exports and be replaced by raster ones; turning the caches
+        off for an export would throw away those of the view instead. The
+        copy is built once and shared by every export until the diagram
+        changes, so exporting several formats in a row lays it out once.
+        """
+        if self._export_copy is None:
+            self._export_copy = build_scene(self._project)
+        return self._export_copy
+
     def export_to_svg(self, file_path: str) -> bool:
         """Export the diagram to SVG format."""
         try:
-            # Get bounding rect of all items with margin
-            items_rect = self._scene.itemsBoundingRect()
+            items_rect = self._export_rect()
             if items_rect.isEmpty():
                 return False
 
-            margin = 20
-            items_rect.adjust(-margin, -margin, margin, margin)
-
-            generator = QSvgGenerator()
-            generator.setFileName(file_path)
-            generator.setSize(items_rect.size().toSize())
-            generator.setViewBox(QRectF(0, 0, items_rect.width(), items_rect.height()))
-            generator.setTitle("Merisio MCD Diagram")
-
-            painter = QPainter()
-            painter.begin(generator)
-            painter.setRenderHint(QPainter.Antialiasing)
-            self._scene.render(painter, QRectF(0, 0, items_rect.width(), items_rect.height()), items_rect)
-            painter.end()
+            render_svg(self._export_scene(), items_rect, file_path)
             return True
         except Exception:
             return False
@@ -600,25 +1083,23 @@ class MCDCanvas(QGraphicsView):
     def export_to_png(self, file_path: str, scale: float = 2.0) -> bool:
         """Export the diagram to PNG format with optional scale for higher resolution."""
         try:
-            # Get bounding rect of all items with margin
-            items_rect = self._scene.itemsBoundingRect()
+            items_rect = self._export_rect()
             if items_rect.isEmpty():
                 return False
 
-            margin = 20
-            items_rect.adjust(-margin, -margin, margin, margin)
-
             # Create image with scaled size for better quality
             width = int(items_rect.width() * scale)
             height = int(items_rect.height() * scale)
-            image = QImage(width, height, QImage.Format_ARGB32)
+            # Premultiplied is the raster engine's native format (no conversion
+            # per blend); pixels are opaque, so the saved PNG is unchanged
+            image = QImage(width, height, QImage.Format_ARGB32_Premultiplied)
             image.fill(QColor(255, 255, 255))  # White background
 
             painter = QPainter()
             painter.begin(image)
             painter.setRenderHint(QPainter.Antialiasing)
             painter.setRenderHint(QPainter.SmoothPixmapTransform)
-            self._scene.render(painter, QRectF(0, 0, width, height), items_rect)
+            self._export_scene().render(painter, QRectF(0, 0, width, height), items_rect)
             painter.end()
 
             return image.save(file_path, "PNG")
@@ -628,35 +1109,11 @@ class MCDCanvas(QGraphicsView):
     def export_to_pdf(self, file_path: str) -> bool:
         """Export the diagram to PDF format."""
         try:
-            from PySide6.QtGui import QPdfWriter
-
-            # Get bounding rect of all items with margin
-            items_rect = self._scene.itemsBoundingRect()
+            items_rect = self._export_rect()
             if items_rect.isEmpty():
                 return False
 
-            margin = 20
-            items_rect.adjust(-margin, -margin, margin, margin)
-
-            writer = QPdfWriter(file_path)
-            writer.setTitle("Merisio MCD Diagram")
-            writer.setCreator("Merisio")
-
-            # Set page size to fit the diagram
-            page_size = QPageSize(QSizeF(items_rect.width(), items_rect.height()), QPageSize.Point)
-            writer.setPageSize(page_size)
-            writer.setPageMargins(QMarginsF(0, 0, 0, 0))
-
-            painter = QPainter()
-            painter.begin(writer)
-            painter.setRenderHint(QPainter.Antialiasing)
-
-            # Scale to fit the PDF page
-            scale = min(writer.width() / items_rect.width(), writer.height() / items_rect.height())
-            painter.scale(scale, scale)
-
-            self._scene.render(painter, QRectF(0, 0, items_rect.width(), items_rect.height()), items_rect)
-            painter.end()
+            render_pdf(self._export_scene(), items_rect, file_path)
             return True
         except Exception:
             return False
@@ -666,31 +1123,40 @@ class MCDCanvas(QGraphicsView):
         self._show_attributes = show
         EntityItem.show_attributes = show
         AssociationItem.show_attributes = show
-        # Refresh all entity items
-        for item in self._entity_items.values():
-            item.refresh()
-        # Refresh all association items
-        for item in self._association_items.values():
-            item.refresh()
-        # Update all links (positions may change due to resized items)
-        for link_item in self._link_items.values():
-            link_item.update_position()
+        with self._suspend_updates():
+            # Resize all entity and association items and re-index them; links
+            # are updated once afterwards rather than once per endpoint
+            for item_id, item in self._entity_items.items():
+                item.refresh(update_links=False)
+                self._index_item(item_id, item)
+            for item_id, item in self._association_items.items():
+                item.refresh(update_links=False)
+                self._index_item(item_id, item)
+            # Update all links (positions may change due to resized items)
+            for link_item in self._link_items.values():
+                link_item.update_position()
+        self._invalidate_items_rect()
+        self._invalidate_lod_cache()
+
+    def set_show_grid(self, show: bool):
+        """Toggle the background grid."""
+        self._show_grid = show
+        self.viewport().update()
 
     def set_link_style(self, style: str):
         """Set the link style: 'curved', 'orthogonal', or 'straight'."""
         self._link_style = style
         LinkItem.link_style = style
         # Update all link items
-        for link_item in self._link_items.values():
-            link_item.update_position()
+        with self._suspend_updates():
+            for link_item in self._link_items.values():
+                link_item.update_position()
+        self._invalidate_items_rect()
+        self._invalidate_lod_cache()
 
     def apply_colors(self, colors: dict):
         """Apply color settings from project to all items."""
-        EntityItem.fill_color = colors.get("entity_fill", "#E3F2FD")
-        EntityItem.border_color = colors.get("entity_border", "#1976D2")
-        AssociationItem.fill_color = colors.get("association_fill", "#FFF3E0")
-        AssociationItem.border_color = colors.get("association_border", "#F57C00")
-        LinkItem.line_color = colors.get("link_color", "#000000")
+        set_item_colors(colors)
 
         # Refresh all items to apply new colors
         for item in self._entity_items.values():
@@ -698,4 +1164,5 @@ class MCDCanvas(QGraphicsView):
         for item in self._association_items.values():
             item.update()
         for item in self._link_items.values():
-            item.update()
+            item.update_style()
+        self._invalidate_lod_cache()
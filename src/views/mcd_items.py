@@ -1,12 +1,14 @@
 from PySide6.QtWidgets import (
-    QGraphicsItem, QGraphicsRectItem, QGraphicsEllipseItem,
-    QGraphicsLineItem, QGraphicsTextItem, QGraphicsPathItem,
-    QStyleOptionGraphicsItem, QWidget
+    QGraphicsItem, QGraphicsPathItem, QStyle, QStyleOptionGraphicsItem, QWidget
 )
-from PySide6.QtCore import Qt, QRectF, QPointF, QLineF
+from PySide6.QtCore import Qt, QRectF, QPointF, QLine
 from PySide6.QtGui import (
-    QPainter, QPen, QBrush, QColor, QFont, QFontMetrics, QPainterPath
+    QPainter, QPen, QBrush, QColor, QFont, QFontMetrics, QPainterPath,
+    QPixmap, QStaticText, QTransform
 )
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Callable, NamedTuple
 import math
 
 from ..models.entity import Entity
@@ -17,6 +19,172 @@ from ..utils.constants import (
     ASSOCIATION_WIDTH, ASSOCIATION_HEIGHT, ASSOCIATION_COLOR, ASSOCIATION_BORDER,
     LINK_COLOR, SELECTED_COLOR
 )
+from .geometry import edge_point, quad_point
+
+
+@lru_cache(maxsize=4096)
+def _static_text(text: str, font_desc: str) -> QStaticText:
+    """Lay out a label once per (text, font); keyed by QFont.toString()."""
+    font = QFont()
+    font.fromString(font_desc)
+    static = QStaticText(text)
+    static.setTextFormat(Qt.PlainText)
+    static.prepare(QTransform(), font)
+    return static
+
+
+@lru_cache(maxsize=None)
+def _font(bold: bool = False, italic: bool = False, underline: bool = False,
+          point_delta: int = 0) -> QFont:
+    """Get the default font in a style, built once per style.
+
+    The font is shared by all items, so it must not be modified.
+    """
+    font = QFont()
+    font.setBold(bold)
+    font.setItalic(italic)
+    font.setUnderline(underline)
+    if point_delta:
+        font.setPointSize(font.pointSize() + point_delta)
+    return font
+
+
+@lru_cache(maxsize=None)
+def _card_font() -> QFont:
+    """Get the font of the link cardinality labels, built once."""
+    font = QFont()
+    font.setBold(True)
+    font.setPointSize(9)
+    return font
+
+
+@lru_cache(maxsize=None)
+def _font_metrics(bold: bool = False, italic: bool = False) -> QFontMetrics:
+    """Get the metrics of the default font in a style, built once per style."""
+    return QFontMetrics(_font(bold, italic))
+
+
+@lru_cache(maxsize=4096)
+def _text_width(text: str, bold: bool = False, italic: bool = False) -> int:
+    """Measure a label in the default font; each (text, style) is shaped once."""
+    return _font_metrics(bold, italic).horizontalAdvance(text)
+
+
+def _paints_on_screen(painter: QPainter) -> bool:
+    """Tell whether a painter draws on screen (a view or an item's pixmap cache).
+
+    QStaticText is laid out at the screen resolution, so exports (SVG, PDF,
+    pictures, images) lay their text out for their own device instead.
+    """
+    return isinstance(painter.device(), (QWidget, QPixmap))
+
+
+def _draw_label(painter: QPainter, rect: QRectF, flags, text: str):
+    """Draw a single-line label in a rectangle with the painter's font.
+
+    Equivalent to painter.drawText(rect, flags, text) for the alignments
+    used by the items, but reuses the cached text layout across repaints
+    on screen.
+    """
+    font = painter.font()
+    if font.underline() or not _paints_on_screen(painter):
+        # QStaticText does not draw text decorations, and is only laid out
+        # for the screen
+        painter.drawText(rect, flags, text)
+        return
+    static = _static_text(text, font.toString())
+    size = static.size()
+    if flags & Qt.AlignHCenter:
+        x = rect.center().x() - size.width() / 2
+    else:
+        x = rect.left()
+    y = rect.center().y() - size.height() / 2
+    # Whole-pixel positions draw faster and reuse the same cached glyphs
+    painter.drawStaticText(round(x), round(y), static)
+
+
+# Alignment of the attribute row labels
+_ROW_ALIGNMENT = Qt.AlignLeft | Qt.AlignVCenter
+
+
+class _ShapeStyle(NamedTuple):
+    """Pens and brushes of an entity/association, built once per color change."""
+
+    pen: QPen
+    brush: QBrush
+    selected_pen: QPen
+    selected_brush: QBrush
+    separator_pen: QPen
+
+
+def _shape_style(fill_color: str, border_color: str, pen_width: int) -> _ShapeStyle:
+    """Build the pens and brushes of a shape from its colors."""
+    border = QColor(border_color)
+    selected = QColor(SELECTED_COLOR)
+    return _ShapeStyle(
+        QPen(border, pen_width), QBrush(QColor(fill_color)),
+        QPen(selected, pen_width), QBrush(selected.lighter(150)),
+        QPen(border, 1),
+    )
+
+
+def set_item_colors(colors: dict):
+    """Apply project color settings to all diagram items."""
+    EntityItem.fill_color = colors.get("entity_fill", "#E3F2FD")
+    EntityItem.border_color = colors.get("entity_border", "#1976D2")
+    AssociationItem.fill_color = colors.get("association_fill", "#FFF3E0")
+    AssociationItem.border_color = colors.get("association_border", "#F57C00")
+    LinkItem.line_color = colors.get("link_color", "#000000")
+    for cls in (EntityItem, AssociationItem, LinkItem):
+        cls._invalidate_style()
+
+
+# Links waiting for a position update, while inside deferred_link_updates()
+_deferred_links: set["LinkItem"] | None = None
+
+
+def _update_links(links: dict["LinkItem", Callable[[], None]]):
+    """Update the position of links after one of their ends moved.
+
+    Takes an item's links, mapped to their bound update_position methods.
+    """
+    if _deferred_links is None:
+        for update_position in links.values():
+            update_position()
+    else:
+        _deferred_links.update(links)
+
+
+@contextmanager
+def deferred_link_updates():
+    """Update each link whose ends move inside the block once, at its end.
+
+    Dragging a selection moves every selected item in turn; a link between
+    two of them would otherwise be recomputed for each end. The yielded set
+    holds the pending links; callers may add other links to update with them.
+    """
+    global _deferred_links
+    if _deferred_links is not None:
+        # Nested: the outermost block does the updates
+        yield _deferred_links
+        return
+    _deferred_links = set()
+    try:
+        yield _deferred_links
+    finally:
+        links, _deferred_links = _deferred_links, None
+        for link_item in links:
+            link_item.update_position()
+
+
+def _content_key(name: str, attributes, show_attributes: bool) -> tuple:
+    """Snapshot what an entity/association item draws, to detect changes.
+
+    Attributes are edited in place, so their fields are copied out.
+    """
+    return (name, show_attributes, tuple(
+        (attr.name, attr.data_type, attr.size, attr.is_primary_key) for attr in attributes
+    ))
 
 
 class EntityItem(QGraphicsItem):
@@ -27,10 +195,22 @@ class EntityItem(QGraphicsItem):
     HEADER_HEIGHT = 30
     ATTR_HEIGHT = 20
     MIN_WIDTH = ENTITY_WIDTH
+    PEN_WIDTH = 2
+    MIN_ATTRIBUTES_LOD = 0.4  # Below this scale, attribute rows are not drawn
+    MIN_TEXT_LOD = 0.2  # Below this scale, no text is drawn at all
+
+    # Class-level setting for cheaper on-screen painting of large diagrams
+    reduced_graphics = False
 
     # Class-level colors (can be updated from project settings)
     fill_color = ENTITY_COLOR
     border_color = ENTITY_BORDER
+    _style: _ShapeStyle | None = None  # Built from the colors on first paint
+
+    @classmethod
+    def _invalidate_style(cls):
+        """Drop the cached pens and brushes after a color change."""
+        cls._style = None
 
     def __init__(self, entity: Entity, parent=None):
         super().__init__(parent)
@@ -38,120 +218,170 @@ class EntityItem(QGraphicsItem):
         self.setPos(entity.x, entity.y)
         self.setFlag(QGraphicsItem.ItemIsMovable)
         self.setFlag(QGraphicsItem.ItemIsSelectable)
-        self.setFlag(QGraphicsItem.ItemSendsGeometryChanges)
+        # Get the exact exposed rect in paint(), to skip hidden labels
+        self.setFlag(QGraphicsItem.ItemUsesExtendedStyleOption)
+        # ItemSendsGeometryChanges is only set while links are attached
         self.setCursor(Qt.OpenHandCursor)
-        self._links: list["LinkItem"] = []
+        # Ordered link set (O(1) add/remove), mapping each link to its bound
+        # update_position method to skip the method lookup while dragging
+        self._links: dict["LinkItem", Callable[[], None]] = {}
+        self._content = self._content_key()
         self._update_size()
 
     def _update_size(self):
         """Update size based on content."""
         self.prepareGeometryChange()
         # Measure entity name with bold font (as drawn)
-        bold_font = QFont()
-        bold_font.setBold(True)
-        fm_bold = QFontMetrics(bold_font)
-        name_width = fm_bold.horizontalAdvance(self.entity.name) + 20
-
-        if EntityItem.show_attributes and self.entity.attributes:
-            self._width = max(self.MIN_WIDTH, name_width, self._calculate_width())
+        name_width = _text_width(self.entity.name, bold=True) + 20
+
+        # Full layout (header and attribute rows) or compact (name only);
+        # paint() branches on this flag instead of re-checking both
+        self._full = EntityItem.show_attributes and bool(self.entity.attributes)
+        if self._full:
+            # Each label is read once, then measured and laid out below
+            labels = [(attr.display_text, attr.is_primary_key) for attr in self.entity.attributes]
+            self._width = max(self.MIN_WIDTH, name_width, self._calculate_width(labels))
             self._height = self.HEADER_HEIGHT + len(self.entity.attributes) * self.ATTR_HEIGHT + 10
         else:
             self._width = max(self.MIN_WIDTH, name_width)
             self._height = ENTITY_HEIGHT
 
-    def _calculate_width(self):
-        """Calculate width based on longest attribute text."""
-        fm = QFontMetrics(QFont())
+        # Cache the outline (centred on the item position) and the bounding
+        # rect, which adds the half of the border pen drawn outside it; the
+        # half size is also read by the links for their edge points
+        self._half_width = self._width / 2
+        self._half_height = self._height / 2
+        self._rect = QRectF(-self._half_width, -self._half_height, self._width, self._height)
+        margin = self.PEN_WIDTH / 2
+        self._bounding_rect = self._rect.adjusted(-margin, -margin, margin, margin)
+        self._header_rect = QRectF(
+            self._rect.left(), self._rect.top(), self._rect.width(), self.HEADER_HEIGHT
+        )
+        sep_y = int(self._rect.top() + self.HEADER_HEIGHT)
+        self._separator = QLine(int(self._rect.left() + 5), sep_y, int(self._rect.right() - 5), sep_y)
+
+        # Lay out the attribute rows as (text rect, label, is primary key)
+        self._attr_rows: list[tuple[QRectF, str, bool]] = []
+        if self._full:
+            rect = self._rect
+            y = rect.top() + self.HEADER_HEIGHT + 5
+            for label, is_primary_key in labels:
+                text_rect = QRectF(rect.left() + 10, y, rect.width() - 20, self.ATTR_HEIGHT)
+                self._attr_rows.append((text_rect, label, is_primary_key))
+                y += self.ATTR_HEIGHT
+
+    def _calculate_width(self, labels: list[tuple[str, bool]]):
+        """Calculate width based on longest attribute label."""
         max_width = 0
-        for attr in self.entity.attributes:
-            attr_text = f"{attr.name} : {attr.data_type}"
-            if attr.size:
-                attr_text += f"({attr.size})"
-            max_width = max(max_width, fm.horizontalAdvance(attr_text))
+        for label, _ in labels:
+            max_width = max(max_width, _text_width(label))
         return max_width + 20  # padding
 
     def boundingRect(self) -> QRectF:
-        return QRectF(-self._width / 2, -self._height / 2, self._width, self._height)
+        return self._bounding_rect
 
     def paint(self, painter: QPainter, option: QStyleOptionGraphicsItem, widget: QWidget = None):
-        rect = self.boundingRect()
-        path = QPainterPath()
-        path.addRoundedRect(rect, 3, 3)  # Sharp corners (minimal rounding)
+        exposed = option.exposedRect
+        if exposed.isEmpty():
+            return
+        rect = self._rect
+        # Axis-aligned box: antialiasing costs time for no visible benefit on
+        # screen; exports keep it for the rounded corners
+        if _paints_on_screen(painter):
+            painter.setRenderHint(QPainter.Antialiasing, False)
 
         # Fill
-        if self.isSelected():
-            painter.setBrush(QBrush(QColor(SELECTED_COLOR).lighter(150)))
-            painter.setPen(QPen(QColor(SELECTED_COLOR), 2))
+        style = EntityItem._style
+        if style is None:
+            style = EntityItem._style = _shape_style(
+                EntityItem.fill_color, EntityItem.border_color, self.PEN_WIDTH
+            )
+        if option.state & QStyle.State_Selected:
+            painter.setBrush(style.selected_brush)
+            painter.setPen(style.selected_pen)
         else:
-            painter.setBrush(QBrush(QColor(EntityItem.fill_color)))
-            painter.setPen(QPen(QColor(EntityItem.border_color), 2))
+            painter.setBrush(style.brush)
+            painter.setPen(style.pen)
 
-        painter.drawPath(path)
+        # Reduced graphics only applies on screen (cached paints pass no
+        # widget, so the painter's device tells them apart from exports)
+        if EntityItem.reduced_graphics and _paints_on_screen(painter):
+            painter.drawRect(rect)
+        else:
+            painter.drawRoundedRect(rect, 3, 3)  # Sharp corners (minimal rounding)
+
+        # Text is unreadable when zoomed far out: just the shape is drawn
+        lod = option.levelOfDetailFromTransform(painter.worldTransform())
+        if lod < self.MIN_TEXT_LOD:
+            return
 
         # Draw entity name (header)
         painter.setPen(Qt.black)
-        font = QFont()
-        font.setBold(True)
-        painter.setFont(font)
+        painter.setFont(_font(bold=True))
+
+        if self._full:
+            # Draw header with name, unless it is outside the exposed area
+            if self._header_rect.intersects(exposed):
+                _draw_label(painter, self._header_rect, Qt.AlignCenter, self.entity.name)
 
-        if EntityItem.show_attributes and self.entity.attributes:
-            # Draw header with name
-            header_rect = QRectF(rect.left(), rect.top(), rect.width(), self.HEADER_HEIGHT)
-            painter.drawText(header_rect, Qt.AlignCenter, self.entity.name)
+            # Attribute rows are unreadable at a larger scale already
+            if lod < self.MIN_ATTRIBUTES_LOD:
+                return
 
             # Draw separator line
-            sep_y = rect.top() + self.HEADER_HEIGHT
-            painter.setPen(QPen(QColor(EntityItem.border_color), 1))
-            painter.drawLine(int(rect.left() + 5), int(sep_y), int(rect.right() - 5), int(sep_y))
+            painter.setPen(style.separator_pen)
+            painter.drawLine(self._separator)
 
             # Draw attributes
-            font.setBold(False)
-            painter.setFont(font)
+            painter.setFont(_font())
             painter.setPen(Qt.black)
 
-            y = rect.top() + self.HEADER_HEIGHT + 5
-            for attr in self.entity.attributes:
-                attr_text = f"{attr.name} : {attr.data_type}"
-                if attr.size:
-                    attr_text += f"({attr.size})"
-
-                text_rect = QRectF(rect.left() + 10, y, rect.width() - 20, self.ATTR_HEIGHT)
-
-                if attr.is_primary_key:
-                    # Underline for primary key
-                    font.setUnderline(True)
-                    painter.setFont(font)
-                    painter.drawText(text_rect, Qt.AlignLeft | Qt.AlignVCenter, attr_text)
-                    font.setUnderline(False)
-                    painter.setFont(font)
+            # Rows outside the exposed area (e.g. scrolled off-screen) are
+            # skipped; primary keys are drawn last, to switch fonts only once
+            key_rows = []
+            for text_rect, attr_text, is_primary_key in self._attr_rows:
+                if not text_rect.intersects(exposed):
+                    continue
+                if is_primary_key:
+                    key_rows.append((text_rect, attr_text))
                 else:
-                    painter.drawText(text_rect, Qt.AlignLeft | Qt.AlignVCenter, attr_text)
+                    _draw_label(painter, text_rect, _ROW_ALIGNMENT, attr_text)
 
-                y += self.ATTR_HEIGHT
+            if key_rows:
+                # Underline for primary key
+                painter.setFont(_font(underline=True))
+                for text_rect, attr_text in key_rows:
+                    _draw_label(painter, text_rect, _ROW_ALIGNMENT, attr_text)
         else:
             # Compact mode - just name centered
-            painter.drawText(rect, Qt.AlignCenter, self.entity.name)
+            _draw_label(painter, rect, Qt.AlignCenter, self.entity.name)
 
     def itemChange(self, change, value):
         if change == QGraphicsItem.ItemPositionHasChanged:
-            # Update entity coordinates
-            pos = self.pos()
-            self.entity.x = pos.x()
-            self.entity.y = pos.y()
+            self.store_position()
             # Update connected links
-            for link_item in self._links:
-                link_item.update_position()
+            _update_links(self._links)
         return super().itemChange(change, value)
 
+    def store_position(self):
+        """Copy the item position to the entity coordinates."""
+        pos = self.pos()
+        self.entity.x = pos.x()
+        self.entity.y = pos.y()
+
     def add_link(self, link_item: "LinkItem"):
         """Register a link item connected to this entity."""
         if link_item not in self._links:
-            self._links.append(link_item)
+            self._links[link_item] = link_item.update_position
+            # Position changes only need to be reported while links follow us
+            self.setFlag(QGraphicsItem.ItemSendsGeometryChanges, True)
 
     def remove_link(self, link_item: "LinkItem"):
         """Unregister a link item."""
         if link_item in self._links:
-            self._links.remove(link_item)
+            del self._links[link_item]
+            if not self._links:
+                self.setFlag(QGraphicsItem.ItemSendsGeometryChanges, False)
 
     def get_center(self) -> QPointF:
         """Get the center point in scene coordinates."""
@@ -160,37 +390,30 @@ class EntityItem(QGraphicsItem):
     def get_edge_point(self, target: QPointF) -> QPointF:
         """Get the point on the rectangle edge closest to the target."""
         center = self.scenePos()
-        dx = target.x() - center.x()
-        dy = target.y() - center.y()
-
-        if dx == 0 and dy == 0:
-            return center
-
-        # Half dimensions
-        hw = self._width / 2
-        hh = self._height / 2
-
-        # Calculate intersection with rectangle edges
-        if abs(dx) * hh > abs(dy) * hw:
-            # Intersects left or right edge
-            if dx > 0:
-                return QPointF(center.x() + hw, center.y() + dy * hw / dx)
-            else:
-                return QPointF(center.x() - hw, center.y() - dy * hw / dx)
-        else:
-            # Intersects top or bottom edge
-            if dy > 0:
-                return QPointF(center.x() + dx * hh / dy, center.y() + hh)
-            else:
-                return QPointF(center.x() - dx * hh / dy, center.y() - hh)
-
-    def refresh(self):
-        """Refresh the item after entity changes."""
-        self._update_size()
-        self.update()
-        # Update connected links
-        for link_item in self._links:
-            link_item.update_position()
+        return QPointF(*edge_point(
+            center.x(), center.y(), self._half_width, self._half_height, target.x(), target.y()
+        ))
+
+    def _content_key(self) -> tuple:
+        return _content_key(self.entity.name, self.entity.attributes, EntityItem.show_attributes)
+
+    def refresh(self, update_links: bool = True):
+        """Refresh the item after entity changes.
+
+        The item is only resized and repainted when its name or attributes
+        changed, and its links only follow when its size changed. Pass
+        update_links=False when refreshing many items at once and updating
+        every link afterwards anyway.
+        """
+        content = self._content_key()
+        if content != self._content:
+            self._content = content
+            size = (self._width, self._height)
+            self._update_size()
+            self.update()
+            if update_links and size != (self._width, self._height):
+                # Update connected links
+                _update_links(self._links)
 
 
 class AssociationItem(QGraphicsItem):
@@ -202,10 +425,22 @@ class AssociationItem(QGraphicsItem):
     ATTR_HEIGHT = 18
     MIN_WIDTH = 80
     MIN_HEIGHT = 40
+    PEN_WIDTH = 2
+    MIN_ATTRIBUTES_LOD = 0.4  # Below this scale, attribute rows are not drawn
+    MIN_TEXT_LOD = 0.2  # Below this scale, no text is drawn at all
+
+    # Class-level setting for cheaper on-screen painting of large diagrams
+    reduced_graphics = False
 
     # Class-level colors (can be updated from project settings)
     fill_color = ASSOCIATION_COLOR
     border_color = ASSOCIATION_BORDER
+    _style: _ShapeStyle | None = None  # Built from the colors on first paint
+
+    @classmethod
+    def _invalidate_style(cls):
+        """Drop the cached pens and brushes after a color change."""
+        cls._style = None
 
     def __init__(self, association: Association, parent=None):
         super().__init__(parent)
@@ -213,109 +448,159 @@ class AssociationItem(QGraphicsItem):
         self.setPos(association.x, association.y)
         self.setFlag(QGraphicsItem.ItemIsMovable)
         self.setFlag(QGraphicsItem.ItemIsSelectable)
-        self.setFlag(QGraphicsItem.ItemSendsGeometryChanges)
+        # Get the exact exposed rect in paint(), to skip hidden labels
+        self.setFlag(QGraphicsItem.ItemUsesExtendedStyleOption)
+        # ItemSendsGeometryChanges is only set while links are attached
         self.setCursor(Qt.OpenHandCursor)
-        self._links: list["LinkItem"] = []
+        # Ordered link set (O(1) add/remove), mapping each link to its bound
+        # update_position method to skip the method lookup while dragging
+        self._links: dict["LinkItem", Callable[[], None]] = {}
+        self._content = self._content_key()
         self._update_size()
 
     def _update_size(self):
         """Update size based on content."""
         self.prepareGeometryChange()
         # Measure association name with italic font (as drawn)
-        italic_font = QFont()
-        italic_font.setItalic(True)
-        fm_italic = QFontMetrics(italic_font)
-        name_width = fm_italic.horizontalAdvance(self.association.name) + 30
+        name_width = _text_width(self.association.name, italic=True) + 30
         self._width = max(self.MIN_WIDTH, name_width)
 
-        if AssociationItem.show_attributes and self.association.attributes:
-            # Calculate width for attributes too
-            fm = QFontMetrics(QFont())
-            for attr in self.association.attributes:
-                attr_text = f"{attr.name} : {attr.data_type}"
-                if attr.size:
-                    attr_text += f"({attr.size})"
-                attr_width = fm.horizontalAdvance(attr_text) + 20
+        # Full layout (header and attribute rows) or compact (name only);
+        # paint() branches on this flag instead of re-checking both
+        self._full = AssociationItem.show_attributes and bool(self.association.attributes)
+        if self._full:
+            # Calculate width for attributes too; each label is read once,
+            # then measured and laid out below
+            labels = [attr.display_text for attr in self.association.attributes]
+            for label in labels:
+                attr_width = _text_width(label) + 20
                 self._width = max(self._width, attr_width)
             self._height = self.HEADER_HEIGHT + len(self.association.attributes) * self.ATTR_HEIGHT + 5
         else:
             self._height = self.MIN_HEIGHT
 
+        # Cache the outline (centred on the item position) and the bounding
+        # rect, which adds the half of the border pen drawn outside it; the
+        # half size is also read by the links for their edge points
+        self._half_width = self._width / 2
+        self._half_height = self._height / 2
+        self._rect = QRectF(-self._half_width, -self._half_height, self._width, self._height)
+        margin = self.PEN_WIDTH / 2
+        self._bounding_rect = self._rect.adjusted(-margin, -margin, margin, margin)
+        self._header_rect = QRectF(
+            self._rect.left(), self._rect.top(), self._rect.width(), self.HEADER_HEIGHT
+        )
+        sep_y = int(self._rect.top() + self.HEADER_HEIGHT - 3)
+        self._separator = QLine(int(self._rect.left() + 10), sep_y, int(self._rect.right() - 10), sep_y)
+
+        # Fully rounded corners (pill shape) when compact
+        self._radius = 15 if self._full else self._height / 2
+
+        # Lay out the attribute rows as (text rect, label)
+        self._attr_rows: list[tuple[QRectF, str]] = []
+        if self._full:
+            rect = self._rect
+            y = rect.top() + self.HEADER_HEIGHT
+            for label in labels:
+                text_rect = QRectF(rect.left() + 8, y, rect.width() - 16, self.ATTR_HEIGHT)
+                self._attr_rows.append((text_rect, label))
+                y += self.ATTR_HEIGHT
+
     def boundingRect(self) -> QRectF:
-        return QRectF(-self._width / 2, -self._height / 2, self._width, self._height)
+        return self._bounding_rect
 
     def paint(self, painter: QPainter, option: QStyleOptionGraphicsItem, widget: QWidget = None):
-        rect = self.boundingRect()
-        path = QPainterPath()
-
-        # Fully rounded corners (pill shape) - radius is half the height
-        radius = self._height / 2 if not (AssociationItem.show_attributes and self.association.attributes) else 15
-        path.addRoundedRect(rect, radius, radius)
+        exposed = option.exposedRect
+        if exposed.isEmpty():
+            return
+        rect = self._rect
+        radius = self._radius
+
+        # The pill outline is curved, so it needs antialiasing (unless reduced
+        # graphics are on screen; exports always get it)
+        painter.setRenderHint(
+            QPainter.Antialiasing,
+            not (AssociationItem.reduced_graphics and _paints_on_screen(painter))
+        )
 
         # Fill
-        if self.isSelected():
-            painter.setBrush(QBrush(QColor(SELECTED_COLOR).lighter(150)))
-            painter.setPen(QPen(QColor(SELECTED_COLOR), 2))
+        style = AssociationItem._style
+        if style is None:
+            style = AssociationItem._style = _shape_style(
+                AssociationItem.fill_color, AssociationItem.border_color, self.PEN_WIDTH
+            )
+        if option.state & QStyle.State_Selected:
+            painter.setBrush(style.selected_brush)
+            painter.setPen(style.selected_pen)
         else:
-            painter.setBrush(QBrush(QColor(AssociationItem.fill_color)))
-            painter.setPen(QPen(QColor(AssociationItem.border_color), 2))
+            painter.setBrush(style.brush)
+            painter.setPen(style.pen)
+
+        painter.drawRoundedRect(rect, radius, radius)
+        # Only the outline is curved: the separator and text are axis-aligned
+        if _paints_on_screen(painter):
+            painter.setRenderHint(QPainter.Antialiasing, False)
 
-        painter.drawPath(path)
+        # Text is unreadable when zoomed far out: just the shape is drawn
+        lod = option.levelOfDetailFromTransform(painter.worldTransform())
+        if lod < self.MIN_TEXT_LOD:
+            return
 
         # Draw association name
         painter.setPen(Qt.black)
-        font = QFont()
-        font.setItalic(True)
-        painter.setFont(font)
+        painter.setFont(_font(italic=True))
+
+        if self._full:
+            # Draw header with name, unless it is outside the exposed area
+            if self._header_rect.intersects(exposed):
+                _draw_label(painter, self._header_rect, Qt.AlignCenter, self.association.name)
 
-        if AssociationItem.show_attributes and self.association.attributes:
-            # Draw header with name
-            header_rect = QRectF(rect.left(), rect.top(), rect.width(), self.HEADER_HEIGHT)
-            painter.drawText(header_rect, Qt.AlignCenter, self.association.name)
+            # Attribute rows are unreadable at a larger scale already
+            if lod < self.MIN_ATTRIBUTES_LOD:
+                return
 
             # Draw separator line
-            sep_y = rect.top() + self.HEADER_HEIGHT - 3
-            painter.setPen(QPen(QColor(AssociationItem.border_color), 1))
-            painter.drawLine(int(rect.left() + 10), int(sep_y), int(rect.right() - 10), int(sep_y))
+            painter.setPen(style.separator_pen)
+            painter.drawLine(self._separator)
 
             # Draw carrying attributes
-            font.setItalic(False)
-            font.setPointSize(font.pointSize() - 1)
-            painter.setFont(font)
+            painter.setFont(_font(point_delta=-1))
             painter.setPen(Qt.black)
 
-            y = rect.top() + self.HEADER_HEIGHT
-            for attr in self.association.attributes:
-                attr_text = f"{attr.name} : {attr.data_type}"
-                if attr.size:
-                    attr_text += f"({attr.size})"
-                text_rect = QRectF(rect.left() + 8, y, rect.width() - 16, self.ATTR_HEIGHT)
-                painter.drawText(text_rect, Qt.AlignLeft | Qt.AlignVCenter, attr_text)
-                y += self.ATTR_HEIGHT
+            # Rows outside the exposed area are skipped
+            for text_rect, attr_text in self._attr_rows:
+                if text_rect.intersects(exposed):
+                    _draw_label(painter, text_rect, _ROW_ALIGNMENT, attr_text)
         else:
             # Simple mode - just name centered
-            painter.drawText(rect, Qt.AlignCenter, self.association.name)
+            _draw_label(painter, rect, Qt.AlignCenter, self.association.name)
 
     def itemChange(self, change, value):
         if change == QGraphicsItem.ItemPositionHasChanged:
-            # Update association coordinates
-            pos = self.pos()
-            self.association.x = pos.x()
-            self.association.y = pos.y()
+            self.store_position()
             # Update connected links
-            for link_item in self._links:
-                link_item.update_position()
+            _update_links(self._links)
         return super().itemChange(change, value)
 
+    def store_position(self):
+        """Copy the item position to the association coordinates."""
+        pos = self.pos()
+        self.association.x = pos.x()
+        self.association.y = pos.y()
+
     def add_link(self, link_item: "LinkItem"):
         """Register a link item connected to this association."""
         if link_item not in self._links:
-            self._links.append(link_item)
+            self._links[link_item] = link_item.update_position
+            # Position changes only need to be reported while links follow us
+            self.setFlag(QGraphicsItem.ItemSendsGeometryChanges, True)
 
     def remove_link(self, link_item: "LinkItem"):
         """Unregister a link item."""
         if link_item in self._links:
-            self._links.remove(link_item)
+            del self._links[link_item]
+            if not self._links:
+                self.setFlag(QGraphicsItem.ItemSendsGeometryChanges, False)
 
     def get_center(self) -> QPointF:
         """Get the center point in scene coordinates."""
@@ -324,37 +609,32 @@ class AssociationItem(QGraphicsItem):
     def get_edge_point(self, target: QPointF) -> QPointF:
         """Get the point on the rounded rectangle edge closest to the target."""
         center = self.scenePos()
-        dx = target.x() - center.x()
-        dy = target.y() - center.y()
-
-        if dx == 0 and dy == 0:
-            return center
-
-        # Half dimensions
-        hw = self._width / 2
-        hh = self._height / 2
+        return QPointF(*edge_point(
+            center.x(), center.y(), self._half_width, self._half_height, target.x(), target.y()
+        ))
 
-        # Calculate intersection with rectangle edges
-        if abs(dx) * hh > abs(dy) * hw:
-            # Intersects left or right edge
-            if dx > 0:
-                return QPointF(center.x() + hw, center.y() + dy * hw / dx)
-            else:
-                return QPointF(center.x() - hw, center.y() - dy * hw / dx)
-        else:
-            # Intersects top or bottom edge
-            if dy > 0:
-                return QPointF(center.x() + dx * hh / dy, center.y() + hh)
-            else:
-                return QPointF(center.x() - dx * hh / dy, center.y() - hh)
+    def _content_key(self) -> tuple:
+        return _content_key(
+            self.association.name, self.association.attributes, AssociationItem.show_attributes
+        )
 
-    def refresh(self):
-        """Refresh the item after association changes."""
-        self._update_size()
-        self.update()
-        # Update connected links
-        for link_item in self._links:
-            link_item.update_position()
+    def refresh(self, update_links: bool = True):
+        """Refresh the item after association changes.
+
+        The item is only resized and repainted when its name or attributes
+        changed, and its links only follow when its size changed. Pass
+        update_links=False when refreshing many items at once and updating
+        every link afterwards anyway.
+        """
+        content = self._content_key()
+        if content != self._content:
+            self._content = content
+            size = (self._width, self._height)
+            self._update_size()
+            self.update()
+            if update_links and size != (self._width, self._height):
+                # Update connected links
+                _update_links(self._links)
 
 
 class LinkItem(QGraphicsPathItem):
@@ -363,8 +643,29 @@ class LinkItem(QGraphicsPathItem):
     # Class-level setting for link style
     link_style = "curved"  # "curved", "orthogonal", "straight"
 
+    # Class-level setting for cheaper on-screen painting of large diagrams
+    reduced_graphics = False
+
+    # Space between the cardinality text and its box
+    CARD_MARGIN_X = 7
+    CARD_MARGIN_Y = 4
+    MIN_TEXT_LOD = 0.2  # Below this scale, the cardinality text is not drawn
+
     # Class-level color (can be updated from project settings)
     line_color = LINK_COLOR
+    _pens: tuple[QPen, QPen] | None = None  # (normal, selected), built on first use
+
+    @classmethod
+    def _invalidate_style(cls):
+        """Drop the cached pens after a color change."""
+        cls._pens = None
+
+    @classmethod
+    def _get_pens(cls) -> tuple[QPen, QPen]:
+        """Get the (normal, selected) line pens for the current color."""
+        if cls._pens is None:
+            cls._pens = (QPen(QColor(cls.line_color), 1), QPen(QColor(SELECTED_COLOR), 2))
+        return cls._pens
 
     def __init__(
         self,
@@ -378,28 +679,27 @@ class LinkItem(QGraphicsPathItem):
         self.entity_item = entity_item
         self.association_item = association_item
 
+        # Cardinality label, drawn in paint() inside a white box
+        self._card_text = ""
+        self._card_static = QStaticText()
+        self._card_box = QRectF()  # Label box centered on the origin
+        self._card_rect = QRectF()
+        self._card_pos = QPointF()  # Top-left of the text
+        self._bounding_rect = QRectF()  # Line and label box
+
         self.setFlag(QGraphicsItem.ItemIsSelectable)
-        self.setPen(QPen(QColor(LinkItem.line_color), 1))
+        self.setPen(LinkItem._get_pens()[0])
         self.setBrush(Qt.NoBrush)
 
-        # Create background for cardinality label (white box)
-        self._card_bg = QGraphicsRectItem(self)
-        self._card_bg.setBrush(QBrush(QColor("white")))
-        self._card_bg.setPen(QPen(QColor(LinkItem.line_color), 1))
-
-        # Create cardinality label
-        self._card_label = QGraphicsTextItem(self)
-        font = QFont()
-        font.setBold(True)
-        font.setPointSize(9)
-        self._card_label.setFont(font)
-        self._card_label.setDefaultTextColor(QColor("black"))
-
         # Store points for curve calculation
         self._p1 = QPointF()
         self._p2 = QPointF()
         self._control = QPointF()
 
+        # Path rebuilt in place by update_position (at most 4 elements)
+        self._path = QPainterPath()
+        self._path.reserve(4)
+
         # Register with connected items
         entity_item.add_link(self)
         association_item.add_link(self)
@@ -408,20 +708,26 @@ class LinkItem(QGraphicsPathItem):
 
     def update_position(self):
         """Update link position based on connected items and current style."""
-        # Get centers first to calculate direction
-        entity_center = self.entity_item.get_center()
-        assoc_center = self.association_item.get_center()
+        # Get centers first to calculate direction (read once per end)
+        entity_item, assoc_item = self.entity_item, self.association_item
+        entity_center = entity_item.scenePos()
+        assoc_center = assoc_item.scenePos()
+        ex, ey = entity_center.x(), entity_center.y()
+        ax, ay = assoc_center.x(), assoc_center.y()
 
         # Get edge points (where line meets the shape borders)
-        self._p1 = self.entity_item.get_edge_point(assoc_center)
-        self._p2 = self.association_item.get_edge_point(entity_center)
+        x1, y1 = edge_point(ex, ey, entity_item._half_width, entity_item._half_height, ax, ay)
+        x2, y2 = edge_point(ax, ay, assoc_item._half_width, assoc_item._half_height, ex, ey)
+        self._p1 = QPointF(x1, y1)
+        self._p2 = QPointF(x2, y2)
 
         # Calculate midpoint
-        mid_x = (self._p1.x() + self._p2.x()) / 2
-        mid_y = (self._p1.y() + self._p2.y()) / 2
+        mid_x = (x1 + x2) / 2
+        mid_y = (y1 + y2) / 2
 
-        # Create path based on style
-        path = QPainterPath()
+        # Create path based on style (set once the label is placed too)
+        path = self._path
+        path.clear()
         path.moveTo(self._p1)
 
         if LinkItem.link_style == "straight":
@@ -451,66 +757,117 @@ class LinkItem(QGraphicsPathItem):
 
         else:  # "curved" (default)
             # Quadratic Bezier curve
-            dx = self._p2.x() - self._p1.x()
-            dy = self._p2.y() - self._p1.y()
-            length = math.sqrt(dx * dx + dy * dy)
+            dx = x2 - x1
+            dy = y2 - y1
+            length = math.hypot(dx, dy)
 
             if length > 0:
                 # Perpendicular vector (normalized)
-                perp_x = -dy / length
-                perp_y = dx / length
+                inv_length = 1.0 / length
+                perp_x = -dy * inv_length
+                perp_y = dx * inv_length
                 # Curve amount (proportional to distance, but capped)
                 curve_amount = min(length * 0.15, 30)
-                self._control = QPointF(mid_x + perp_x * curve_amount, mid_y + perp_y * curve_amount)
+                control_x = mid_x + perp_x * curve_amount
+                control_y = mid_y + perp_y * curve_amount
             else:
-                self._control = QPointF(mid_x, mid_y)
+                control_x, control_y = mid_x, mid_y
+            self._control = QPointF(control_x, control_y)
 
             path.quadTo(self._control, self._p2)
 
-        self.setPath(path)
-
         # Position cardinality label near entity edge
         # For curved: use point on Bezier at t=0.2
         # For others: use point 20% along the path
         t = 0.2
         if LinkItem.link_style == "curved":
-            label_x = (1-t)*(1-t)*self._p1.x() + 2*(1-t)*t*self._control.x() + t*t*self._p2.x()
-            label_y = (1-t)*(1-t)*self._p1.y() + 2*(1-t)*t*self._control.y() + t*t*self._p2.y()
+            label_x, label_y = quad_point(x1, y1, control_x, control_y, x2, y2, t)
         else:
-            label_x = self._p1.x() + t * (self._p2.x() - self._p1.x())
-            label_y = self._p1.y() + t * (self._p2.y() - self._p1.y())
+            label_x = x1 + t * (x2 - x1)
+            label_y = y1 + t * (y2 - y1)
 
+        # The text is only laid out (and its box sized) again when the
+        # cardinality changed
         card_text = f"{self.link.cardinality_min},{self.link.cardinality_max}"
-        self._card_label.setPlainText(card_text)
-
-        # Get text bounding rect for background sizing
-        text_rect = self._card_label.boundingRect()
-        padding = 3
-
-        # Position the background rectangle
-        bg_width = text_rect.width() + padding * 2
-        bg_height = text_rect.height()
-        self._card_bg.setRect(
-            label_x - bg_width / 2,
-            label_y - bg_height / 2,
-            bg_width,
-            bg_height
+        if card_text != self._card_text:
+            self._card_text = card_text
+            self._card_static = _static_text(card_text, _card_font().toString())
+            size = self._card_static.size()
+            bg_width = size.width() + self.CARD_MARGIN_X * 2
+            bg_height = size.height() + self.CARD_MARGIN_Y * 2
+            self._card_box = QRectF(-bg_width / 2, -bg_height / 2, bg_width, bg_height)
+
+        # Center the label box on the label point; it is part of the bounding rect
+        self.prepareGeometryChange()
+        self._card_rect = self._card_box.translated(label_x, label_y)
+        self._card_pos = QPointF(
+            self._card_rect.left() + self.CARD_MARGIN_X, self._card_rect.top() + self.CARD_MARGIN_Y
         )
+        self.setPath(path)
+        self._update_bounding_rect()
+
+    def update_style(self):
+        """Set the pens for the current selection state and link color."""
+        normal, selected = LinkItem._get_pens()
+        pen = selected if self.isSelected() else normal
+        # setPen() repaints (and may resize) the item, so only call it on change
+        if self.pen() != pen:
+            self.setPen(pen)
+            self._update_bounding_rect()
+
+    def itemChange(self, change, value):
+        if change == QGraphicsItem.ItemSelectedHasChanged:
+            # The selected pen is wider: change it (and the bounding rect)
+            # before repainting, so partial viewport updates cover it
+            self.update_style()
+        return super().itemChange(change, value)
+
+    def _update_bounding_rect(self):
+        """Cache the union of the line and label box bounds.
 
-        # Position the text centered on the background
-        self._card_label.setPos(
-            label_x - text_rect.width() / 2,
-            label_y - text_rect.height() / 2
+        Called after setPath()/setPen(), which already prepared the
+        geometry change.
+        """
+        # Half of the label box pen is drawn outside it
+        self._bounding_rect = super().boundingRect().united(
+            self._card_rect.adjusted(-0.5, -0.5, 0.5, 0.5)
         )
 
+    def boundingRect(self) -> QRectF:
+        return self._bounding_rect
+
+    def shape(self) -> QPainterPath:
+        # Clicking the label hits the link too
+        label = QPainterPath()
+        label.addRect(self._card_rect)
+        return super().shape().united(label)
+
     def paint(self, painter: QPainter, option: QStyleOptionGraphicsItem, widget: QWidget = None):
-        if self.isSelected():
-            self.setPen(QPen(QColor(SELECTED_COLOR), 2))
-        else:
-            self.setPen(QPen(QColor(LinkItem.line_color), 1))
-        # Update cardinality box border color
-        self._card_bg.setPen(QPen(QColor(LinkItem.line_color), 1))
+        # Only the link line is antialiased; its label box keeps the painter's hint
+        antialiased = painter.testRenderHint(QPainter.Antialiasing)
+        painter.setRenderHint(
+            QPainter.Antialiasing, not (LinkItem.reduced_graphics and _paints_on_screen(painter))
+        )
         super().paint(painter, option, widget)
+        painter.setRenderHint(QPainter.Antialiasing, antialiased)
+
+        # Cardinality label (white box)
+        painter.setPen(LinkItem._get_pens()[0])
+        painter.setBrush(Qt.white)
+        painter.drawRect(self._card_rect)
+
+        # Text is unreadable when zoomed far out: just the box is drawn. (Links
+        # do not use extended style options, so their exposed rect is always
+        # the whole bounding rect and is not worth checking.)
+        if option.levelOfDetailFromTransform(painter.worldTransform()) < self.MIN_TEXT_LOD:
+            return
+        painter.setPen(Qt.black)
+        painter.setFont(_card_font())
+        if _paints_on_screen(painter):
+            painter.drawStaticText(self._card_pos, self._card_static)
+        else:
+            # Exports lay the text out for their own device (see _draw_label)
+            painter.drawText(self._card_rect, Qt.AlignCenter, self._card_text)
 
     def cleanup(self):
         """Remove this link from connected items."""
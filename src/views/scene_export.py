@@ -0,0 +1,97 @@
+"""Diagram export scenes and their SVG and PDF output, shared by the canvas and the CLI."""
+
+from PySide6.QtCore import QMarginsF, QRectF, QSizeF
+from PySide6.QtGui import QGuiApplication, QPageSize, QPainter, QPdfWriter
+from PySide6.QtSvg import QSvgGenerator
+from PySide6.QtWidgets import QGraphicsScene
+
+from ..models.project import Project
+from .mcd_items import EntityItem, AssociationItem, LinkItem
+
+TITLE = "Merisio MCD Diagram"
+
+
+def build_scene(project: Project) -> QGraphicsScene:
+    """Build a QGraphicsScene populated with all project items.
+
+    The items are not cached, so exports paint them directly.
+    """
+    scene = QGraphicsScene()
+
+    entity_items = {}
+    association_items = {}
+
+    for entity in project.get_all_entities():
+        item = EntityItem(entity)
+        scene.addItem(item)
+        entity_items[entity.id] = item
+
+    for assoc in project.get_all_associations():
+        item = AssociationItem(assoc)
+        scene.addItem(item)
+        association_items[assoc.id] = item
+
+    for link in project.get_all_links():
+        entity_item = entity_items.get(link.entity_id)
+        assoc_item = association_items.get(link.association_id)
+        if entity_item and assoc_item:
+            item = LinkItem(link, entity_item, assoc_item)
+            scene.addItem(item)
+
+    return scene
+
+
+def layout_dpi() -> int:
+    """Get the resolution the items' text is measured at.
+
+    Items size their labels with device-less font metrics, which use the
+    primary screen's resolution. Exports draw one scene unit per pixel at
+    that resolution, so fonts keep their size relative to the shapes.
+    """
+    return round(QGuiApplication.primaryScreen().logicalDotsPerInchY())
+
+
+def render_svg(scene: QGraphicsScene, source: QRectF, file_path: str):
+    """Render an area of a scene to an SVG file."""
+    generator = QSvgGenerator()
+    generator.setFileName(file_path)
+    generator.setSize(source.size().toSize())
+    generator.setViewBox(QRectF(0, 0, source.width(), source.height()))
+    generator.setResolution(layout_dpi())
+    generator.setTitle(TITLE)
+
+    painter = QPainter()
+    painter.begin(generator)
+    # Vector output: antialiasing is up to the viewer
+    painter.setRenderHint(QPainter.TextAntialiasing)
+    scene.render(painter, QRectF(0, 0, source.width(), source.height()), source)
+    painter.end()
+
+
+def render_pdf(scene: QGraphicsScene, source: QRectF, file_path: str):
+    """Render an area of a scene to a single-page PDF file."""
+    dpi = layout_dpi()
+    writer = QPdfWriter(file_path)
+    writer.setTitle(TITLE)
+    writer.setCreator("Merisio")
+    # Fonts are sized for the writer's resolution: drawing at the default
+    # 1200 dpi scaled down to the page would enlarge all the text
+    writer.setResolution(dpi)
+
+    # Set page size to fit the diagram
+    points = 72 / dpi
+    page_size = QPageSize(QSizeF(source.width() * points, source.height() * points), QPageSize.Point)
+    writer.setPageSize(page_size)
+    writer.setPageMargins(QMarginsF(0, 0, 0, 0))
+
+    painter = QPainter()
+    painter.begin(writer)
+    # Vector output: antialiasing is up to the viewer
+    painter.setRenderHint(QPainter.TextAntialiasing)
+
+    # Scale to fit the PDF page (whole points)
+    scale = min(writer.width() / source.width(), writer.height() / source.height())
+    painter.scale(scale, scale)
+
+    scene.render(painter, QRectF(0, 0, source.width(), source.height()), source)
+    painter.end()
@@ -0,0 +1,153 @@
+"""Spatial index for hit-testing diagram items."""
+
+import math
+from typing import Hashable, Iterator
+
+# Rectangles are (x, y, width, height) tuples, like QRectF's constructor.
+Rect = tuple[float, float, float, float]
+
+
+def _intersects(a: Rect, b: Rect) -> bool:
+    """Check whether two rectangles overlap (edges included)."""
+    return (a[0] <= b[0] + b[2] and b[0] <= a[0] + a[2] and
+            a[1] <= b[1] + b[3] and b[1] <= a[1] + a[3])
+
+
+def _contains(outer: Rect, inner: Rect) -> bool:
+    """Check whether a rectangle fully contains another."""
+    return (outer[0] <= inner[0] and outer[1] <= inner[1] and
+            inner[0] + inner[2] <= outer[0] + outer[2] and
+            inner[1] + inner[3] <= outer[1] + outer[3])
+
+
+class _QuadNode:
+    """A quadtree node; holds the items that do not fit entirely in one child."""
+
+    __slots__ = ("bounds", "depth", "items", "children")
+
+    def __init__(self, bounds: Rect, depth: int):
+        self.bounds = bounds
+        self.depth = depth
+        self.items: dict[Hashable, Rect] = {}
+        self.children: list["_QuadNode"] | None = None
+
+    def child_for(self, rect: Rect) -> "_QuadNode | None":
+        """Get the child that fully contains a rectangle, if any."""
+        for child in self.children:
+            if _contains(child.bounds, rect):
+                return child
+        return None
+
+    def split(self):
+        """Create the four children of this node."""
+        x, y, w, h = self.bounds
+        hw, hh = w / 2, h / 2
+        depth = self.depth + 1
+        self.children = [
+            _QuadNode((x, y, hw, hh), depth),
+            _QuadNode((x + hw, y, hw, hh), depth),
+            _QuadNode((x, y + hh, hw, hh), depth),
+            _QuadNode((x + hw, y + hh, hw, hh), depth),
+        ]
+
+    def query(self, rect: Rect) -> Iterator[Hashable]:
+        """Yield the keys of items in this subtree intersecting a rectangle."""
+        for key, item_rect in self.items.items():
+            if _intersects(rect, item_rect):
+                yield key
+        if self.children is not None:
+            for child in self.children:
+                if _intersects(rect, child.bounds):
+                    yield from child.query(rect)
+
+
+class QuadTree:
+    """Quadtree over axis-aligned rectangles, keyed by item id.
+
+    Items are stored in the deepest node that fully contains them. When an
+    item reaches outside the root bounds, the root grows (doubling its size)
+    until it fits, so far-away items do not pile up in one unsplit node.
+    Query results are returned in insertion order, so callers can resolve
+    overlaps by stacking order (the last result is the topmost item).
+    """
+
+    MAX_ITEMS = 10  # Items per node before it splits
+    MAX_DEPTH = 8
+
+    def __init__(self, x: float, y: float, width: float, height: float):
+        self._bounds: Rect = (x, y, width, height)
+        self.clear()
+
+    def clear(self):
+        """Remove all items."""
+        self._root = _QuadNode(self._bounds, 0)
+        self._nodes: dict[Hashable, _QuadNode] = {}  # key -> node holding it
+        self._order: dict[Hashable, int] = {}  # key -> insertion rank
+        self._counter = 0
+
+    def insert(self, key: Hashable, rect: Rect):
+        """Insert an item, or update its rectangle if already present."""
+        if key in self._nodes:
+            node = self._nodes.pop(key)
+            del node.items[key]
+        else:
+            self._order[key] = self._counter
+            self._counter += 1
+        if not _contains(self._root.bounds, rect) and all(map(math.isfinite, rect)):
+            self._grow(rect)
+        self._place(self._root, key, rect)
+
+    def remove(self, key: Hashable):
+        """Remove an item (no-op if absent)."""
+        node = self._nodes.pop(key, None)
+        if node is not None:
+            del node.items[key]
+            del self._order[key]
+
+    def query(self, rect: Rect) -> list[Hashable]:
+        """Get the keys of all items intersecting a rectangle."""
+        return sorted(self._root.query(rect), key=self._order.__getitem__)
+
+    def query_point(self, x: float, y: float) -> list[Hashable]:
+        """Get the keys of all items whose rectangle contains a point."""
+        return self.query((x, y, 0.0, 0.0))
+
+    def _grow(self, rect: Rect):
+        """Enlarge the root until it contains a rectangle, then re-place all items."""
+        x, y, w, h = self._root.bounds
+        while not _contains((x, y, w, h), rect):
+            # Double around the current bounds, towards the rectangle
+            x = x - w if rect[0] < x else x
+            y = y - h if rect[1] < y else y
+            w, h = (w or 1) * 2, (h or 1) * 2
+
+        items = [(key, node.items[key]) for key, node in self._nodes.items()]
+        self._root = _QuadNode((x, y, w, h), 0)
+        self._nodes = {}
+        for key, item_rect in items:
+            self._place(self._root, key, item_rect)
+
+    def _place(self, node: _QuadNode, key: Hashable, rect: Rect):
+        """Store an item in the deepest node of a subtree that can hold it."""
+        while node.children is not None:
+            child = node.child_for(rect)
+            if child is None:
+                break
+            node = child
+
+        node.items[key] = rect
+        self._nodes[key] = node
+
+        if (node.children is None and len(node.items) > self.MAX_ITEMS
+                and node.depth < self.MAX_DEPTH):
+            node.split()
+            for item_key, item_rect in list(node.items.items()):
+                if node.child_for(item_rect) is not None:
+                    del node.items[item_key]
+                    self._place(node, item_key, item_rect)
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._nodes
@@ -1,6 +1,6 @@
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QTextEdit,
-    QPushButton, QMessageBox, QFileDialog
+    QPushButton, QMessageBox, QFileDialog, QApplication
 )
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QFont, QTextCharFormat, QColor, QSyntaxHighlighter
@@ -123,7 +123,6 @@ class SQLView(QWidget):
 
     def _copy_to_clipboard(self):
         """Copy SQL to clipboard."""
-        from PySide6.QtWidgets import QApplication
         text = self._text_edit.toPlainText()
         if text:
             QApplication.clipboard().setText(text)
@@ -0,0 +1,194 @@
+"""Tests for the MCD canvas."""
+
+import os
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import pytest
+from PySide6.QtWidgets import QApplication, QMessageBox
+
+from src.models.association import Association
+from src.models.entity import Entity
+from src.models.link import Link
+from src.models.project import Project
+from src.views.mcd_canvas import MCDCanvas
+from src.views.mcd_items import AssociationItem, EntityItem, LinkItem
+
+
+@pytest.fixture(scope="module")
+def app():
+    return QApplication.instance() or QApplication([])
+
+
+def make_project() -> Project:
+    project = Project()
+    entity = Entity(name="CLIENT")
+    project.add_entity(entity)
+    association = Association(name="PASSER")
+    association.x, association.y = 300, 0
+    project.add_association(association)
+    project.add_link(Link(entity_id=entity.id, association_id=association.id))
+    return project
+
+
+def make_canvas(project: Project) -> MCDCanvas:
+    canvas = MCDCanvas(project)
+    canvas.refresh()
+    return canvas
+
+
+def scene_items(canvas: MCDCanvas, cls) -> set:
+    return {item for item in canvas._scene.items() if type(item) is cls}
+
+
+def assert_in_sync(canvas: MCDCanvas, project: Project):
+    """Check the items and the scene match the project, one item per object."""
+    assert {eid: item.entity for eid, item in canvas._entity_items.items()} == {
+        entity.id: entity for entity in project.get_all_entities()
+    }
+    assert {aid: item.association for aid, item in canvas._association_items.items()} == {
+        assoc.id: assoc for assoc in project.get_all_associations()
+    }
+    assert {lid: item.link for lid, item in canvas._link_items.items()} == {
+        link.id: link for link in project.get_all_links()
+    }
+    assert scene_items(canvas, EntityItem) == set(canvas._entity_items.values())
+    assert scene_items(canvas, AssociationItem) == set(canvas._association_items.values())
+    assert scene_items(canvas, LinkItem) == set(canvas._link_items.values())
+    for link_item in canvas._link_items.values():
+        assert link_item.entity_item is canvas._entity_items[link_item.link.entity_id]
+        assert link_item.association_item is canvas._association_items[link_item.link.association_id]
+    assert len(canvas._qtree) == len(canvas._entity_items) + len(canvas._association_items)
+
+
+class TestSyncItems:
+    """Tests for refreshing the canvas items from the project."""
+
+    def test_keeps_items(self, app):
+        project = make_project()
+        canvas = make_canvas(project)
+        items = (dict(canvas._entity_items), dict(canvas._association_items), dict(canvas._link_items))
+
+        entity = project.get_all_entities()[0]
+        entity.name = "CUSTOMER"
+        entity.x = 50
+        canvas.refresh()
+
+        assert (canvas._entity_items, canvas._association_items, canvas._link_items) == items
+        assert canvas._entity_items[entity.id].pos().x() == 50
+        assert_in_sync(canvas, project)
+
+    def test_adds_items(self, app):
+        project = make_project()
+        canvas = make_canvas(project)
+        kept = dict(canvas._entity_items)
+
+        entity = Entity(name="PRODUIT")
+        entity.x = 0
+        entity.y = 200
+        project.add_entity(entity)
+        association = project.get_all_associations()[0]
+        project.add_link(Link(entity_id=entity.id, association_id=association.id))
+        canvas.refresh()
+
+        assert len(canvas._entity_items) == 2
+        assert len(canvas._link_items) == 2
+        assert all(canvas._entity_items[eid] is item for eid, item in kept.items())
+        assert_in_sync(canvas, project)
+
+    def test_removes_items(self, app):
+        project = make_project()
+        canvas = make_canvas(project)
+        association_item = next(iter(canvas._association_items.values()))
+
+        # Removes its link too
+        project.remove_entity(project.get_all_entities()[0].id)
+        canvas.refresh()
+
+        assert canvas._entity_items == {}
+        assert canvas._link_items == {}
+        assert list(canvas._association_items.values()) == [association_item]
+        assert_in_sync(canvas, project)
+
+    def test_replaces_items(self, app):
+        project = make_project()
+        canvas = make_canvas(project)
+        entity = project.get_all_entities()[0]
+        old_item = canvas._entity_items[entity.id]
+        old_link_item = next(iter(canvas._link_items.values()))
+        association_item = next(iter(canvas._association_items.values()))
+
+        # Same id, new object
+        project.add_entity(Entity(name="CUSTOMER", id=entity.id))
+        canvas.refresh()
+
+        item = canvas._entity_items[entity.id]
+        assert item is not old_item
+        assert item.entity.name == "CUSTOMER"
+        # The link is attached to the new item; the association is kept
+        assert next(iter(canvas._link_items.values())) is not old_link_item
+        assert next(iter(canvas._association_items.values())) is association_item
+        assert_in_sync(canvas, project)
+
+    def test_rebuilds_after_project_switch(self, app, monkeypatch):
+        canvas = make_canvas(make_project())
+        old_items = set(canvas._scene.items())
+        rebuilds = []
+        rebuild_items = canvas._rebuild_items
+        monkeypatch.setattr(canvas, "_rebuild_items", lambda: rebuilds.append(1) or rebuild_items())
+
+        project = make_project()
+        canvas.set_project(project)
+
+        assert rebuilds == [1]
+        assert not old_items & set(canvas._scene.items())
+        assert_in_sync(canvas, project)
+
+
+class TestDeleteSelected:
+    """Tests for deleting the selected items."""
+
+    def test_deletes_items_and_their_links(self, app, monkeypatch):
+        monkeypatch.setattr(QMessageBox, "question", lambda *args: QMessageBox.Yes)
+        project = make_project()
+        client = project.get_all_entities()[0]
+        passer = project.get_all_associations()[0]
+        shared_link = project.get_all_links()[0]
+        produit = Entity(name="PRODUIT")
+        produit.y = 200
+        project.add_entity(produit)
+        commander = Association(name="COMMANDER")
+        commander.x, commander.y = 300, 200
+        project.add_association(commander)
+        client_link = Link(entity_id=client.id, association_id=commander.id)
+        standalone_link = Link(entity_id=produit.id, association_id=commander.id)
+        project.add_link(client_link)
+        project.add_link(standalone_link)
+        canvas = make_canvas(project)
+
+        # The link between CLIENT and PASSER goes with both of them, and is
+        # selected too
+        for item in (
+            canvas._entity_items[client.id],
+            canvas._association_items[passer.id],
+            canvas._link_items[shared_link.id],
+            canvas._link_items[standalone_link.id],
+        ):
+            item.setSelected(True)
+        removed = []
+        remove_item = canvas._scene.removeItem
+        monkeypatch.setattr(canvas._scene, "removeItem", lambda item: removed.append(item) or remove_item(item))
+        canvas.delete_selected()
+
+        # Each item is taken off the scene once: the three links, the two items
+        assert len(removed) == len(set(removed)) == 5
+
+        assert project.get_all_entities() == [produit]
+        assert project.get_all_associations() == [commander]
+        assert project.get_all_links() == []
+        assert list(canvas._entity_items) == [produit.id]
+        assert list(canvas._association_items) == [commander.id]
+        assert canvas._link_items == {}
+        assert canvas._qtree.query_point(client.x, client.y) == []
+        assert canvas._qtree.query_point(passer.x, passer.y) == []
+        assert_in_sync(canvas, project)
@@ -0,0 +1,192 @@
+"""Tests for the diagram exports."""
+
+import os
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import pytest
+from PySide6.QtCore import QRectF, QSize
+from PySide6.QtGui import QColor, QImage, QPainter
+from PySide6.QtPdf import QPdfDocument
+from PySide6.QtSvg import QSvgRenderer
+from PySide6.QtWidgets import QApplication
+
+from src.export.renderer import HeadlessRenderer
+from src.models.association import Association
+from src.models.attribute import Attribute
+from src.models.entity import Entity
+from src.models.link import Link
+from src.models.project import Project
+from src.views.mcd_canvas import MCDCanvas
+from src.views.mcd_items import EntityItem, LinkItem
+from src.views.scene_export import build_scene
+
+# Exports add this margin around the items
+MARGIN = 20
+# Exports are rasterized at this scale
+SCALE = 2
+
+
+@pytest.fixture(scope="module")
+def app():
+    return QApplication.instance() or QApplication([])
+
+
+def make_project() -> Project:
+    project = Project()
+    entity = Entity(name="CLIENT")
+    entity.attributes.append(Attribute(name="id_client", data_type="INT", is_primary_key=True))
+    entity.attributes.append(Attribute(name="nom", data_type="VARCHAR", size=50))
+    project.add_entity(entity)
+    return project
+
+
+def make_linked_project() -> Project:
+    project = make_project()
+    association = Association(name="PASSER")
+    association.x, association.y = 300, 0
+    project.add_association(association)
+    entity = project.get_all_entities()[0]
+    project.add_link(Link(entity_id=entity.id, association_id=association.id))
+    return project
+
+
+def rasterize_svg(path: str) -> QImage:
+    renderer = QSvgRenderer(path)
+    size = (renderer.viewBoxF().size() * SCALE).toSize()
+    image = QImage(size, QImage.Format_ARGB32)
+    image.fill(QColor(255, 255, 255))
+    painter = QPainter(image)
+    renderer.render(painter)
+    painter.end()
+    return image
+
+
+def rasterize_pdf(path: str, source: QRectF) -> QImage:
+    document = QPdfDocument()
+    document.load(path)
+    return document.render(0, (source.size() * SCALE).toSize())
+
+
+def dark_span(image: QImage, rect: QRectF) -> tuple[float, float]:
+    """Get the horizontal extent of the black (text) pixels in a scene rect."""
+    xs = []
+    for y in range(int(rect.top() * SCALE), int(rect.bottom() * SCALE)):
+        for x in range(int(rect.left() * SCALE), int(rect.right() * SCALE)):
+            color = image.pixelColor(x, y)
+            if max(color.red(), color.green(), color.blue()) < 100:
+                xs.append(x)
+    assert xs, "no text found"
+    return min(xs) / SCALE, (max(xs) + 1) / SCALE
+
+
+def header_rect(item: EntityItem) -> QRectF:
+    """Get the inside of an entity's header, in export coordinates."""
+    rect = item.sceneBoundingRect()
+    return QRectF(MARGIN + 4, MARGIN + 4, rect.width() - 8, item.HEADER_HEIGHT - 8)
+
+
+def row_rect(item: EntityItem, row: int) -> QRectF:
+    """Get an attribute row of an entity, in export coordinates."""
+    rect = item.sceneBoundingRect()
+    top = MARGIN + item.HEADER_HEIGHT + 5 + row * item.ATTR_HEIGHT
+    return QRectF(MARGIN + 4, top, rect.width() - 8, item.ATTR_HEIGHT)
+
+
+class TestSvgExport:
+    """Tests for the SVG export."""
+
+    def test_entity_name_is_centered(self, app, tmp_path):
+        project = make_project()
+        path = str(tmp_path / "diagram.svg")
+        assert HeadlessRenderer(project).export_svg(path)
+
+        item = EntityItem(project.get_all_entities()[0])
+        rect = header_rect(item)
+        left, right = dark_span(rasterize_svg(path), rect)
+        assert (left + right) / 2 == pytest.approx(rect.center().x(), abs=1.5)
+
+    def test_canvas_export_matches_png(self, app, tmp_path):
+        project = make_project()
+        canvas = MCDCanvas(project)
+        canvas.refresh()
+        svg_path = str(tmp_path / "diagram.svg")
+        png_path = str(tmp_path / "diagram.png")
+        assert canvas.export_to_svg(svg_path)
+        assert canvas.export_to_png(png_path, scale=SCALE)
+
+        # The text and the primary key underline have the same extent
+        item = EntityItem(project.get_all_entities()[0])
+        svg_image = rasterize_svg(svg_path)
+        png_image = QImage(png_path)
+        for row in range(len(item.entity.attributes)):
+            rect = row_rect(item, row)
+            assert dark_span(svg_image, rect) == pytest.approx(dark_span(png_image, rect), abs=1.5)
+
+    def test_cli_export_matches_canvas(self, app, tmp_path):
+        project = make_project()
+        canvas = MCDCanvas(project)
+        canvas.refresh()
+        canvas_path = str(tmp_path / "canvas.svg")
+        cli_path = str(tmp_path / "cli.svg")
+        assert canvas.export_to_svg(canvas_path)
+        assert HeadlessRenderer(project).export_svg(cli_path)
+
+        item = EntityItem(project.get_all_entities()[0])
+        canvas_image = rasterize_svg(canvas_path)
+        cli_image = rasterize_svg(cli_path)
+        for row in range(len(item.entity.attributes)):
+            rect = row_rect(item, row)
+            assert dark_span(cli_image, rect) == pytest.approx(dark_span(canvas_image, rect), abs=1.5)
+
+
+class TestCanvasExport:
+    """Tests for the canvas exports."""
+
+    def test_formats_share_the_export_scene(self, app, tmp_path):
+        project = make_linked_project()
+        canvas = MCDCanvas(project)
+        canvas.refresh()
+        assert canvas.export_to_png(str(tmp_path / "diagram.png"))
+        scene = canvas._export_scene()
+        assert canvas.export_to_svg(str(tmp_path / "diagram.svg"))
+        assert canvas.export_to_pdf(str(tmp_path / "diagram.pdf"))
+        assert canvas._export_scene() is scene
+        assert len(scene.items()) == 3
+
+        # A change to the diagram builds a new copy
+        canvas.refresh()
+        assert canvas._export_scene() is not scene
+
+
+    def test_entity_corners_are_antialiased(self, app, tmp_path):
+        project = make_project()
+        canvas = MCDCanvas(project)
+        canvas.refresh()
+        path = str(tmp_path / "diagram.png")
+        assert canvas.export_to_png(path, scale=SCALE)
+
+        # Blended pixels between the border, the fill and the background
+        image = QImage(path)
+        corner = range(MARGIN * SCALE - 2, (MARGIN + 4) * SCALE)
+        colors = {image.pixel(x, y) for x in corner for y in corner}
+        assert len(colors) > 4
+
+
+class TestPdfExport:
+    """Tests for the PDF export."""
+
+    def test_cardinality_is_centered(self, app, tmp_path):
+        project = make_linked_project()
+        path = str(tmp_path / "diagram.pdf")
+        assert HeadlessRenderer(project).export_pdf(path)
+
+        # Lay the diagram out again to find the label box
+        scene = build_scene(project)
+        link_item = next(item for item in scene.items() if isinstance(item, LinkItem))
+        source = scene.itemsBoundingRect().adjusted(-MARGIN, -MARGIN, MARGIN, MARGIN)
+
+        # Inside the box border
+        box = link_item._card_rect.translated(-source.topLeft()).adjusted(2, 2, -2, -2)
+        left, right = dark_span(rasterize_pdf(path, source), box)
+        assert (left + right) / 2 == pytest.approx(box.center().x(), abs=1.5)
@@ -0,0 +1,38 @@
+"""Tests for the link geometry helpers."""
+
+import pytest
+from src.views.geometry import edge_point, quad_point
+
+
+class TestEdgePoint:
+    """Tests for edge_point."""
+
+    def test_left_and_right_edges(self):
+        assert edge_point(0, 0, 50, 20, 100, 10) == (50, 5)
+        assert edge_point(0, 0, 50, 20, -100, 10) == (-50, 5)
+
+    def test_top_and_bottom_edges(self):
+        assert edge_point(0, 0, 50, 20, 10, 100) == (2, 20)
+        assert edge_point(0, 0, 50, 20, 10, -100) == (2, -20)
+
+    def test_corner_direction(self):
+        assert edge_point(10, 10, 50, 20, 60, 30) == pytest.approx((60, 30))
+
+    def test_target_at_center(self):
+        assert edge_point(5, 5, 50, 20, 5, 5) == (5, 5)
+
+
+class TestQuadPoint:
+    """Tests for quad_point."""
+
+    def test_end_points(self):
+        assert quad_point(0, 0, 50, 100, 100, 0, 0) == (0, 0)
+        assert quad_point(0, 0, 50, 100, 100, 0, 1) == (100, 0)
+
+    def test_middle(self):
+        assert quad_point(0, 0, 50, 100, 100, 0, 0.5) == (50, 50)
+
+    def test_straight_control(self):
+        x, y = quad_point(0, 0, 50, 0, 100, 0, 0.2)
+        assert x == pytest.approx(20)
+        assert y == 0
@@ -34,6 +34,16 @@ class TestAttribute:
         assert restored.size == attr.size
         assert restored.is_primary_key == attr.is_primary_key
 
+    def test_display_text(self):
+        attr = Attribute(name="nom", data_type="VARCHAR", size=50)
+        assert attr.display_text == "nom : VARCHAR(50)"
+        # The label follows in-place edits
+        attr.name = "prenom"
+        attr.size = None
+        assert attr.display_text == "prenom : VARCHAR"
+        # Formatted once per (name, type, size), shared by equal attributes
+        assert Attribute(name="prenom", data_type="VARCHAR").display_text is attr.display_text
+
 
 class TestEntity:
     """Tests for Entity model."""
@@ -185,6 +195,38 @@ class TestProject:
         assert len(project.get_all_entities()) == 0
         assert len(project.get_all_links()) == 0  # Link should be removed too
 
+    def test_remove_elements(self):
+        project = Project()
+
+        client = Entity(name="Client")
+        produit = Entity(name="Produit")
+        project.add_entity(client)
+        project.add_entity(produit)
+
+        passer = Association(name="Passer")
+        contenir = Association(name="Contenir")
+        project.add_association(passer)
+        project.add_association(contenir)
+
+        link1 = Link(entity_id=client.id, association_id=passer.id)
+        link2 = Link(entity_id=produit.id, association_id=contenir.id)
+        link3 = Link(entity_id=produit.id, association_id=passer.id)
+        for link in (link1, link2, link3):
+            project.add_link(link)
+        project.modified = False
+
+        project.remove_elements(
+            entity_ids=[client.id], association_ids=[contenir.id], link_ids=[link3.id, "unknown"]
+        )
+        assert project.get_all_entities() == [produit]
+        assert project.get_all_associations() == [passer]
+        assert len(project.get_all_links()) == 0
+        assert project.modified is True
+
+        project.modified = False
+        project.remove_elements(entity_ids=["unknown"])
+        assert project.modified is False
+
     def test_serialization(self):
         project = Project()
 
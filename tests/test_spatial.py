@@ -0,0 +1,79 @@
+"""Tests for the spatial index."""
+
+import pytest
+from src.views.spatial import QuadTree
+
+
+class TestQuadTree:
+    """Tests for QuadTree."""
+
+    def test_insert_and_query_point(self):
+        tree = QuadTree(-100, -100, 200, 200)
+        tree.insert("a", (0, 0, 10, 10))
+        tree.insert("b", (50, 50, 10, 10))
+        assert tree.query_point(5, 5) == ["a"]
+        assert tree.query_point(55, 55) == ["b"]
+        assert tree.query_point(30, 30) == []
+        assert len(tree) == 2
+
+    def test_query_rect(self):
+        tree = QuadTree(-100, -100, 200, 200)
+        tree.insert("a", (0, 0, 10, 10))
+        tree.insert("b", (50, 50, 10, 10))
+        tree.insert("c", (-90, -90, 5, 5))
+        assert tree.query((-5, -5, 60, 60)) == ["a", "b"]
+
+    def test_update_moves_item(self):
+        tree = QuadTree(-100, -100, 200, 200)
+        tree.insert("a", (0, 0, 10, 10))
+        tree.insert("a", (80, 80, 10, 10))
+        assert tree.query_point(5, 5) == []
+        assert tree.query_point(85, 85) == ["a"]
+        assert len(tree) == 1
+
+    def test_remove(self):
+        tree = QuadTree(-100, -100, 200, 200)
+        tree.insert("a", (0, 0, 10, 10))
+        tree.remove("a")
+        tree.remove("missing")
+        assert "a" not in tree
+        assert tree.query_point(5, 5) == []
+
+    def test_results_in_insertion_order(self):
+        tree = QuadTree(-100, -100, 200, 200)
+        tree.insert("bottom", (0, 0, 20, 20))
+        tree.insert("top", (10, 10, 20, 20))
+        # Updating an item keeps its stacking rank
+        tree.insert("bottom", (5, 5, 20, 20))
+        assert tree.query_point(15, 15) == ["bottom", "top"]
+
+    def test_many_items_split_nodes(self):
+        tree = QuadTree(0, 0, 1000, 1000)
+        for i in range(200):
+            x, y = (i % 20) * 50, (i // 20) * 50
+            tree.insert(i, (x, y, 10, 10))
+        assert len(tree) == 200
+        for i in range(200):
+            x, y = (i % 20) * 50, (i // 20) * 50
+            assert tree.query_point(x + 5, y + 5) == [i]
+        for i in range(0, 200, 2):
+            tree.remove(i)
+        assert tree.query((0, 0, 1000, 1000)) == list(range(1, 200, 2))
+
+    def test_items_outside_bounds(self):
+        tree = QuadTree(0, 0, 100, 100)
+        tree.insert("far", (500, 500, 10, 10))
+        assert tree.query_point(505, 505) == ["far"]
+
+    def test_root_grows_to_fit_items(self):
+        tree = QuadTree(0, 0, 100, 100)
+        tree.insert("near", (10, 10, 10, 10))
+        for i in range(30):
+            tree.insert(i, (-1000 + i * 60, 900, 10, 10))
+        assert tree.query_point(15, 15) == ["near"]
+        assert tree.query_point(-995, 905) == [0]
+        assert tree.query_point(745, 905) == [29]
+        # Far items are spread over child nodes instead of the root
+        assert len(tree._root.items) < 30
+        # Growing keeps the insertion order
+        assert tree.query((-1000, 0, 2000, 1000)) == ["near", *range(30)]